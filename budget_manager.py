@@ -9,6 +9,8 @@ Usage examples:
       python budget_manager.py --input examples/sample.csv --month 2025-08
   - JSON output (for automation):
       python budget_manager.py --input examples/sample.csv --json
+  - Totals only for very large files (entries are aggregated while streaming):
+      python budget_manager.py --input examples/sample.csv --summary
 
 CSV format (header required):
     type,name,category,amount[,date]
@@ -25,23 +27,40 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gc
 import json
+import re
 import sys
 from collections import defaultdict
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
-from datetime import date as _date
+from functools import reduce
+from operator import add, attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+# Column accessors: pull fields out of the entry lists in C rather than via
+# per-element attribute lookups in a generator.
+_get_amount = attrgetter("amount")
+_first = itemgetter(0)
 
-@dataclass
+# Serialized entry fields, in output order; shared by to_dict() and --json.
+_INCOME_FIELDS = ("name", "amount", "date")
+_EXPENSE_FIELDS = ("name", "amount", "category", "date")
+
+# Read buffer for CSV imports: ~1 MiB of RAM in exchange for far fewer read()
+# syscalls than the default 8 KiB buffer on large files.
+_CSV_READ_BUFFER = 1 << 20
+
+
+@dataclass(slots=True)
 class Income:
     name: str
     amount: float
     date: Optional[str] = None  # YYYY-MM (default: BudgetMonth.month)
 
 
-@dataclass
+@dataclass(slots=True)
 class Expense:
     name: str
     amount: float
@@ -76,139 +95,299 @@ class BudgetMonth:
 
     # Totals
     def total_income(self) -> float:
-        return sum(x.amount for x in self.incomes)
+        return _running_total(map(_get_amount, self.incomes))
 
     def total_expenses(self) -> float:
-        return sum(x.amount for x in self.expenses)
+        return _running_total(map(_get_amount, self.expenses))
 
     def net(self) -> float:
         return self.total_income() - self.total_expenses()
 
     # Percentages and breakdowns
     def expenses_by_category(self) -> Dict[str, float]:
-        buckets: Dict[str, float] = defaultdict(float)
-        for e in self.expenses:
-            buckets[e.category] += e.amount
-        return dict(buckets)
+        return _tally_expenses(self.expenses)[1]
 
     def expense_percentages_by_category(self, relative_to: str = "income") -> Dict[str, float]:
-        base = self.total_income() if relative_to == "income" else self.total_expenses()
-        by_cat = self.expenses_by_category()
-        if base <= 0:
-            # Avoid division by zero; return 0s
-            return {k: 0.0 for k in by_cat}
-        return {k: (v / base) * 100.0 for k, v in by_cat.items()}
+        agg = self._compute_all()
+        return dict(agg["percent_of_income"] if relative_to == "income" else agg["percent_of_expenses"])
 
     def profit_margin(self) -> float:
-        income = self.total_income()
-        if income <= 0:
-            return 0.0
-        return (self.net() / income) * 100.0
+        return self._compute_all()["profit_margin"]
+
+    def summary(self) -> Dict:
+        """Return income, expenses, net, profit_margin, by_category and both
+        percentage maps in one mapping.
+
+        Computed afresh on each call; callers that need the figures several
+        times should keep the returned mapping.
+        """
+        return self._compute_all()
+
+    def _compute_all(self) -> Dict:
+        """Return every aggregate, computed in one pass over each list."""
+        return _aggregates(self.total_income(), *_tally_expenses(self.expenses))
 
     # Serialization helpers (JSON friendly)
     def to_dict(self) -> Dict:
         return {
             "month": self.month,
-            "incomes": [x.__dict__ for x in self.incomes],
-            "expenses": [x.__dict__ for x in self.expenses],
-            "totals": {
-                "income": round(self.total_income(), 2),
-                "expenses": round(self.total_expenses(), 2),
-                "net": round(self.net(), 2),
-                "profit_margin_pct": round(self.profit_margin(), 2),
-            },
-            "breakdown": {
-                "by_category": _round_map(self.expenses_by_category()),
-                "percent_of_income": _round_map(self.expense_percentages_by_category("income")),
-                "percent_of_expenses": _round_map(self.expense_percentages_by_category("expenses")),
-            },
+            "incomes": list(_entry_dicts(self.incomes, _INCOME_FIELDS)),
+            "expenses": list(_entry_dicts(self.expenses, _EXPENSE_FIELDS)),
+            **_summary_sections(self._compute_all()),
         }
 
 
+def _entry_dicts(entries, fields: Tuple[str, ...]) -> Iterator[Dict]:
+    get = attrgetter(*fields)
+    return (dict(zip(fields, get(x))) for x in entries)
+
+
+def _running_total(amounts: Iterable[float]) -> float:
+    """Add amounts up left to right with plain float +=.
+
+    Not sum(): from Python 3.12 it compensates float rounding, so its totals
+    would drift from the ones summarize_csv accumulates row by row.
+    """
+    return reduce(add, amounts, 0.0)
+
+
+def _tally_expenses(expenses: Iterable[Expense]) -> Tuple[float, Dict[str, float]]:
+    """Total and per-category sums of expense amounts in one pass.
+
+    Both use a running +=, in order, so the total equals total_expenses().
+    """
+    total = 0.0
+    buckets: Dict[str, float] = defaultdict(float)
+    for e in expenses:
+        amount = e.amount
+        total += amount
+        buckets[e.category] += amount
+    return total, dict(buckets)
+
+
+def _aggregates(inc_total: float, exp_total: float, by_cat: Dict[str, float]) -> Dict:
+    """Derive net, margin and percentage maps from raw totals."""
+    net = inc_total - exp_total
+    margin = (net / inc_total) * 100.0 if inc_total > 0 else 0.0
+    # Fill both percentage maps in one pass over the categories
+    p_inc: Dict[str, float] = {}
+    p_exp: Dict[str, float] = {}
+    inc_pos = inc_total > 0
+    exp_pos = exp_total > 0
+    for k, v in by_cat.items():
+        p_inc[k] = (v / inc_total) * 100.0 if inc_pos else 0.0
+        p_exp[k] = (v / exp_total) * 100.0 if exp_pos else 0.0
+    return {
+        "income": inc_total,
+        "expenses": exp_total,
+        "net": net,
+        "profit_margin": margin,
+        "by_category": by_cat,
+        "percent_of_income": p_inc,
+        "percent_of_expenses": p_exp,
+    }
+
+
+def _summary_sections(agg: Dict) -> Dict:
+    """Rounded 'totals' and 'breakdown' sections of the JSON report."""
+    return {
+        "totals": {
+            "income": round(agg["income"], 2),
+            "expenses": round(agg["expenses"], 2),
+            "net": round(agg["net"], 2),
+            "profit_margin_pct": round(agg["profit_margin"], 2),
+        },
+        "breakdown": {
+            "by_category": _round_map(agg["by_category"]),
+            "percent_of_income": _round_map(agg["percent_of_income"]),
+            "percent_of_expenses": _round_map(agg["percent_of_expenses"]),
+        },
+    }
+
+
 def _clamp_non_negative(value: float) -> float:
-    try:
-        v = float(value)
-    except Exception:
-        return 0.0
-    return max(0.0, v)
+    if type(value) is not float:
+        try:
+            value = float(value)
+        except (TypeError, ValueError, OverflowError):
+            return 0.0
+    return value if value > 0.0 else 0.0
 
 
 def _round_map(d: Dict[str, float], ndigits: int = 2) -> Dict[str, float]:
     return {k: round(v, ndigits) for k, v in d.items()}
 
 
-def read_csv(path: Path) -> Tuple[List[Income], List[Expense]]:
-    incomes: List[Income] = []
-    expenses: List[Expense] = []
-    with path.open(newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        headers_lower = [h.lower() for h in (reader.fieldnames or [])]
+def _iter_csv_rows(path: Path) -> Iterator[Tuple[str, str, float, Optional[str], Optional[str]]]:
+    """Yield (type, name, amount, category, date) for each income/expense row.
+
+    Amounts are clamped to be non-negative; category is None for incomes.
+    """
+    with path.open(newline='', encoding='utf-8', buffering=_CSV_READ_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Resolve column positions once; rows are then read by index.
+        idx = {h.strip().lower(): i for i, h in enumerate(header)}
         required = {"type", "name", "amount"}
-        missing = required - set(headers_lower)
+        missing = required - idx.keys()
         if missing:
             raise ValueError(f"CSV is missing required headers: {sorted(missing)}")
+        i_type = idx["type"]
+        i_name = idx["name"]
+        i_amount = idx["amount"]
+        i_category = idx.get("category")
+        i_date = idx.get("date")
+        i_year = idx.get("year")
+        i_month = idx.get("month")
+        i_day = idx.get("day")
+        has_year_month = i_year is not None and i_month is not None
+        width = len(header)
+        # Categories and dates repeat across rows; share one string object per
+        # distinct value instead of keeping a fresh copy for every entry.
+        cat_intern: Dict[str, str] = {}
+        date_intern: Dict[str, str] = {}
         for row in reader:
-            row_l = {k.lower(): (v or "").strip() for k, v in row.items()}
-            rtype = row_l.get("type")
-            name = row_l.get("name") or ("Income" if rtype == "income" else "Expense")
-            amount_str = row_l.get("amount") or "0"
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            rtype = row[i_type].strip()
+            if rtype != "income" and rtype != "expense":
+                # Unknown type; skip
+                continue
+            name = row[i_name].strip() or ("Income" if rtype == "income" else "Expense")
             # date can be provided as 'date' (YYYY-MM or YYYY-MM-DD)
             # or via separate 'year' + 'month' [+ 'day'] columns
-            date_val = row_l.get("date")
-            if not date_val:
-                year = row_l.get("year")
-                month = row_l.get("month")
-                day = row_l.get("day")
+            date_val = row[i_date].strip() if i_date is not None else None
+            if not date_val and has_year_month:
+                year = row[i_year].strip()
+                month = row[i_month].strip()
+                day = row[i_day].strip() if i_day is not None else ""
                 if year and month and len(year) == 4 and len(month) in (1, 2):
                     if day and day.isdigit():
                         date_val = f"{year}-{int(month):02d}-{int(day):02d}"
                     else:
                         date_val = f"{year}-{int(month):02d}"
+            if date_val:
+                date_val = date_intern.setdefault(date_val, date_val)
             try:
-                amount = float(amount_str)
+                # float() already ignores surrounding whitespace; a blank cell
+                # falls through to 0.0 like any other unparsable amount.
+                amount = float(row[i_amount])
             except ValueError:
                 amount = 0.0
+            # Already a float: clamp inline rather than via _clamp_non_negative
+            if not amount > 0.0:
+                amount = 0.0
             if rtype == "income":
-                incomes.append(Income(name=name, amount=_clamp_non_negative(amount), date=date_val))
-            elif rtype == "expense":
-                cat = row_l.get("category") or "Uncategorized"
-                expenses.append(Expense(name=name, amount=_clamp_non_negative(amount), category=cat, date=date_val))
+                yield rtype, name, amount, None, date_val
             else:
-                # Unknown type; skip
-                continue
+                cat = (row[i_category].strip() if i_category is not None else "") or "Uncategorized"
+                cat = cat_intern.setdefault(cat, cat)
+                yield rtype, name, amount, cat, date_val
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic GC while building many acyclic objects.
+
+    Every Income/Expense is GC-tracked, so a million-row import otherwise
+    triggers repeated collections that walk the ever-growing lists.
+    gc.disable() is process-wide, so only single-threaded callers (the CLI)
+    should use this.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def read_csv(path: Path, pause_gc: bool = False) -> Tuple[List[Income], List[Expense]]:
+    """Read a CSV into Income and Expense lists.
+
+    pause_gc suspends the cyclic GC for the whole process while reading
+    (see _gc_paused); leave it off when other threads are running.
+    """
+    incomes: List[Income] = []
+    expenses: List[Expense] = []
+    add_income, add_expense = incomes.append, expenses.append
+    with _gc_paused() if pause_gc else nullcontext():
+        for rtype, name, amount, cat, date_val in _iter_csv_rows(path):
+            if rtype == "income":
+                add_income(Income(name=name, amount=amount, date=date_val))
+            else:
+                add_expense(Expense(name=name, amount=amount, category=cat, date=date_val))
     return incomes, expenses
 
 
-def print_report(bm: BudgetMonth, out_stream = sys.stdout) -> None:
-    title = f"Monthly Budget Report{f' for {bm.month}' if bm.month else ''}"
-    print("=" * len(title), file=out_stream)
-    print(title, file=out_stream)
-    print("=" * len(title), file=out_stream)
+def summarize_csv(path: Path) -> Dict:
+    """Aggregate a CSV while streaming it, without keeping per-row entries.
+
+    Returns the same mapping as BudgetMonth._compute_all(): amounts are
+    added in file order with the same running += (_tally_expenses).
+    """
+    inc_total = 0.0
+
+    def expense_rows() -> Iterator[Expense]:
+        # Each Expense is dropped as soon as it is tallied
+        nonlocal inc_total
+        for _rtype, name, amount, cat, _date_val in _iter_csv_rows(path):
+            if cat is None:
+                inc_total += amount
+            else:
+                yield Expense(name, amount, cat)
+
+    exp_total, by_cat = _tally_expenses(expense_rows())
+    return _aggregates(inc_total, exp_total, by_cat)
+
+
+def print_report(bm: BudgetMonth, out_stream=None) -> None:
+    _write_report(bm.month, bm._compute_all(), out_stream)
+
+
+def _write_report(month: Optional[str], agg: Dict, out_stream=None) -> None:
+    # Lines are collected and written in one call rather than one print() each.
+    parts = _report_lines(month, agg)
+    (out_stream if out_stream is not None else sys.stdout).write("\n".join(parts) + "\n")
 
-    inc = bm.total_income()
-    exp = bm.total_expenses()
-    net = bm.net()
-    pm = bm.profit_margin()
+
+def _report_lines(month: Optional[str], agg: Dict) -> List[str]:
+    title = f"Monthly Budget Report{f' for {month}' if month else ''}"
+    rule = "=" * len(title)
+
+    inc = agg["income"]
+    exp = agg["expenses"]
+    net = agg["net"]
+    pm = agg["profit_margin"]
 
     def money(v: float) -> str:
         return f"${v:,.2f}"
 
-    print(f"Total Income:   {money(inc)}", file=out_stream)
-    print(f"Total Expenses: {money(exp)}", file=out_stream)
-    print(f"Net (Profit):   {money(net)}", file=out_stream)
-    print(f"Profit Margin:  {pm:.2f}%", file=out_stream)
-    print("", file=out_stream)
+    parts = [
+        rule,
+        title,
+        rule,
+        f"Total Income:   {money(inc)}",
+        f"Total Expenses: {money(exp)}",
+        f"Net (Profit):   {money(net)}",
+        f"Profit Margin:  {pm:.2f}%",
+        "",
+    ]
 
     # Category table
-    cat = bm.expenses_by_category()
+    cat = agg["by_category"]
     if not cat:
-        print("No expenses entered.", file=out_stream)
-        return
+        parts.append("No expenses entered.")
+        return parts
 
-    p_income = bm.expense_percentages_by_category("income")
-    p_exp = bm.expense_percentages_by_category("expenses")
+    p_income = agg["percent_of_income"]
+    p_exp = agg["percent_of_expenses"]
 
-    rows = [(k, cat[k], p_income.get(k, 0.0), p_exp.get(k, 0.0)) for k in sorted(cat.keys())]
+    rows = [(k, v, p_income.get(k, 0.0), p_exp.get(k, 0.0)) for k, v in cat.items()]
+    rows.sort(key=_first)
     headers = ("Category", "Amount", "% of Income", "% of Expenses")
 
     # Compute column widths
@@ -217,22 +396,53 @@ def print_report(bm: BudgetMonth, out_stream = sys.stdout) -> None:
     col3_w = max(len(headers[2]), *(len(f"{r[2]:.2f}%") for r in rows))
     col4_w = max(len(headers[3]), *(len(f"{r[3]:.2f}%") for r in rows))
 
-    def line(char: str = "-"):
-        print(char * (col1_w + col2_w + col3_w + col4_w + 9), file=out_stream)
+    line = "-" * (col1_w + col2_w + col3_w + col4_w + 9)
 
-    print("Expense Breakdown by Category:", file=out_stream)
-    line()
-    print(
-        f"{headers[0]:<{col1_w}} | {headers[1]:>{col2_w}} | {headers[2]:>{col3_w}} | {headers[3]:>{col4_w}}",
-        file=out_stream,
-    )
-    line()
-    for name, amt, pi, pe in rows:
-        print(
-            f"{name:<{col1_w}} | {amt:>{col2_w},.2f} | {pi:>{col3_w}.2f}% | {pe:>{col4_w}.2f}%",
-            file=out_stream,
-        )
-    line()
+    # Bake the column widths into the templates once instead of re-parsing
+    # nested width specs on every row.
+    header_fmt = f"{{:<{col1_w}}} | {{:>{col2_w}}} | {{:>{col3_w}}} | {{:>{col4_w}}}".format
+    row_fmt = f"{{:<{col1_w}}} | {{:>{col2_w},.2f}} | {{:>{col3_w}.2f}}% | {{:>{col4_w}.2f}}%".format
+
+    parts += ("Expense Breakdown by Category:", line, header_fmt(*headers), line)
+    parts.extend(row_fmt(*r) for r in rows)
+    parts.append(line)
+    return parts
+
+
+def _iter_json_chunks(bm: BudgetMonth) -> Iterator[str]:
+    """Yield the text of json.dumps(bm.to_dict(), indent=2) piece by piece.
+
+    Entries are encoded one at a time, so the list of all entry dicts is
+    never built.
+    """
+    dumps = json.dumps
+    yield '{\n  "month": ' + dumps(bm.month) + ',\n  "incomes": '
+    yield from _iter_json_entries(bm.incomes, _INCOME_FIELDS)
+    yield ',\n  "expenses": '
+    yield from _iter_json_entries(bm.expenses, _EXPENSE_FIELDS)
+    # The summary keys sit at the same depth as in a top-level dump; drop its "{\n".
+    yield ",\n" + dumps(_summary_sections(bm._compute_all()), indent=2)[2:]
+
+
+def _iter_json_entries(entries, fields: Tuple[str, ...]) -> Iterator[str]:
+    """Yield one list of entries as it appears, two levels deep, in the dump."""
+    if not entries:
+        yield "[]"
+        return
+    dumps = json.dumps
+    sep = "[\n    "
+    # json escapes newlines inside strings, so every "\n" is a line break.
+    for d in _entry_dicts(entries, fields):
+        yield sep + dumps(d, indent=2).replace("\n", "\n    ")
+        sep = ",\n    "
+    yield "\n  ]"
+
+
+def write_json(bm: BudgetMonth, *out_streams) -> None:
+    """Write bm as indented JSON to each stream without building to_dict()."""
+    for chunk in _iter_json_chunks(bm):
+        for out in out_streams:
+            out.write(chunk)
 
 
 def interactive_collect(month: Optional[str]) -> BudgetMonth:
@@ -274,8 +484,13 @@ def _ask_amount(prompt: str) -> float:
 
 def _ask_date(default: Optional[str] = None) -> Optional[str]:
     """Ask for a date. Accepts YYYY-MM-DD (preferred) or YYYY-MM. Blank keeps default."""
-    # Provide a sensible default: today's date if no default provided
-    effective_default = default or _date.today().strftime("%Y-%m-%d")
+    # Provide a sensible default: today's date if no default provided.
+    # datetime is imported here so batch (--input) runs never load it.
+    effective_default = default
+    if not effective_default:
+        from datetime import date
+
+        effective_default = date.today().isoformat()
     raw = input(f"Date (YYYY-MM-DD or YYYY-MM) [default {effective_default}]: ").strip()
     if not raw:
         return effective_default
@@ -285,28 +500,27 @@ def _ask_date(default: Optional[str] = None) -> Optional[str]:
     return effective_default
 
 
+# ASCII digits only: str.isdigit() would also accept e.g. "²" (which int()
+# rejects) or Arabic-Indic digits. fullmatch, since "$" allows a trailing newline.
+_RE_YM = re.compile(r"[0-9]{4}-(?:0[1-9]|1[0-2])")
+_RE_YMD = re.compile(r"([0-9]{4})-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])")
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def _is_valid_ym(s: str) -> bool:
-    if len(s) != 7 or s[4] != '-':
-        return False
-    y, m = s.split('-', 1)
-    if not (y.isdigit() and m.isdigit()):
-        return False
-    mi = int(m)
-    return 1 <= mi <= 12
+    return _RE_YM.fullmatch(s) is not None
 
 
 def _is_valid_ymd(s: str) -> bool:
-    if len(s) != 10 or s[4] != '-' or s[7] != '-':
-        return False
-    y, m, d = s.split('-')
-    if not (y.isdigit() and m.isdigit() and d.isdigit()):
+    m = _RE_YMD.fullmatch(s)
+    if m is None:
         return False
-    mi = int(m)
-    di = int(d)
-    if not (1 <= mi <= 12 and 1 <= di <= 31):
-        return False
-    # Basic validation; not checking month/day combos (e.g., Feb 30)
-    return True
+    y, mo, d = int(m[1]), int(m[2]), int(m[3])
+    # Per-month day limits (rejects e.g. Feb 30) without importing datetime
+    if mo == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+        return d <= 29
+    return d <= _DAYS_IN_MONTH[mo]
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -318,6 +532,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     p.add_argument("--month", type=str, help="Month label for the report, e.g., 2025-08.")
     p.add_argument("--json", action="store_true", help="Output JSON instead of a human-readable table.")
     p.add_argument("--save-json", type=str, help="Optional path to save the JSON report.")
+    p.add_argument(
+        "--summary", action="store_true",
+        help="Aggregate --input while reading it without keeping individual entries "
+             "(faster for large files; JSON omits the incomes/expenses lists).",
+    )
     return p.parse_args(argv)
 
 
@@ -330,23 +549,39 @@ def main(argv: Optional[List[str]] = None) -> int:
         if not path.exists():
             print(f"Error: Input file not found: {path}", file=sys.stderr)
             return 2
-        incomes, expenses = read_csv(path)
-        bm.incomes.extend(incomes)
-        bm.expenses.extend(expenses)
+        if args.summary:
+            return _summary_main(args, path)
+        # bm is fresh, so adopt the parsed lists instead of copying them in
+        bm.incomes, bm.expenses = read_csv(path, pause_gc=True)
     else:
         bm = interactive_collect(args.month)
 
     if args.json:
-        data = bm.to_dict()
-        out = json.dumps(data, indent=2)
-        print(out)
         if args.save_json:
-            Path(args.save_json).write_text(out, encoding="utf-8")
+            with open(args.save_json, "w", encoding="utf-8") as fh:
+                write_json(bm, sys.stdout, fh)
+        else:
+            write_json(bm, sys.stdout)
+        sys.stdout.write("\n")
     else:
         print_report(bm)
         if args.save_json:
-            Path(args.save_json).write_text(json.dumps(bm.to_dict(), indent=2), encoding="utf-8")
+            with open(args.save_json, "w", encoding="utf-8") as fh:
+                write_json(bm, fh)
+
+    return 0
+
 
+def _summary_main(args: argparse.Namespace, path: Path) -> int:
+    agg = summarize_csv(path)
+    data = {"month": args.month, **_summary_sections(agg)}
+    if args.json:
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        _write_report(args.month, agg)
+    if args.save_json:
+        Path(args.save_json).write_text(json.dumps(data, indent=2), encoding="utf-8")
     return 0
 
 
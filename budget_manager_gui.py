@@ -4,6 +4,9 @@ Budget Manager GUI (Tkinter)
 - Manage incomes and expenses with per-entry date (YYYY-MM or YYYY-MM-DD)
 - CSV import/export compatible with CLI; includes 'date' column
 - Live report totals, profit margin, and category percentages
+- Excel export via openpyxl, imported on the first export; when the
+  optional lxml is installed openpyxl picks it up automatically and
+  serializes the workbook with its C writer
 Run: python budget_manager_gui.py
 """
 from __future__ import annotations
@@ -14,39 +17,127 @@ import datetime as _dt
 import json
 import math as _math
 import os
+import queue
+import re
+import threading
 import tkinter as tk
+import warnings
+from collections import Counter
+from functools import lru_cache
+from itertools import zip_longest
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 
-from openpyxl import Workbook
-from openpyxl.chart import BarChart, PieChart, Reference
-from openpyxl.chart.label import DataLabelList
-from openpyxl.chart.series import DataPoint
-from openpyxl.formatting.rule import CellIsRule
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side, numbers
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
-
-from budget_manager import BudgetMonth, read_csv
+from budget_manager import BudgetMonth, read_csv, write_json
+
+# Thousands separators to drop from typed amounts; float() itself ignores
+# surrounding whitespace.
+_NO_COMMAS = str.maketrans("", "", ",")
+
+# fullmatch rather than ^...$: "$" would also accept a trailing newline.
+_RE_YM = re.compile(r"[0-9]{4}-(?:0[1-9]|1[0-2])")
+_RE_YMD = re.compile(r"[0-9]{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12][0-9]|3[01])")
+# Either form in one pass; group 1 is the YYYY-MM prefix, group 2 the day.
+_RE_YM_PREFIX = re.compile(r"([0-9]{4}-(?:0[1-9]|1[0-2]))(?:-(0[1-9]|[12][0-9]|3[01]))?")
+
+# Offered by the expense category picker
+_DEFAULT_CATEGORIES = (
+    "Food", "Rent", "Fuel", "Electricity", "Internet", "Water", "Transport",
+    "Healthcare", "Entertainment", "Education", "Clothing", "Savings",
+    "Debt", "Subscriptions", "Gifts", "Misc",
+)
+
+# Slice colours for the expense-category pie, cycled by rank
+_PIE_COLORS = (
+    "#4caf50", "#2196f3", "#ff9800", "#9c27b0", "#00bcd4",
+    "#8bc34a", "#ffc107", "#e91e63", "#795548", "#607d8b",
+)
+# Key/value of (key, value) pairs. Dict keys are unique, so sorting items on
+# _first orders them as plain tuple sorting would, minus the tuple compares.
+_first = itemgetter(0)
+_second = itemgetter(1)
+# The same palette for the exported pie chart (RGB hex without "#")
+_XL_PIE_COLORS = tuple(c[1:].upper() for c in _PIE_COLORS)
 
 
 def _valid_ym(s: str) -> bool:
-    return len(s) == 7 and s[4] == '-' and s[:4].isdigit() and s[5:7].isdigit() and 1 <= int(s[5:7]) <= 12
+    return _RE_YM.fullmatch(s) is not None
 
 
 def _valid_ymd(s: str) -> bool:
-    if len(s) != 10 or s[4] != '-' or s[7] != '-':
-        return False
-    y, m, d = s.split('-')
-    if not (y.isdigit() and m.isdigit() and d.isdigit()):
+    if _RE_YMD.fullmatch(s) is None:
         return False
+    if s[8:] <= "28" and s[:4] != "0000":
+        return True
+    # Only days 29-31 depend on the month/year; let datetime decide those.
     try:
-        _dt.date(int(y), int(m), int(d))
+        _dt.date(int(s[:4]), int(s[5:7]), int(s[8:]))
         return True
     except ValueError:
         return False
 
 
+def _today_ymd() -> str:
+    # isoformat() is the C-level YYYY-MM-DD formatter; no strftime format parsing
+    return _dt.date.today().isoformat()
+
+
+def _today_ym() -> str:
+    return _today_ymd()[:7]
+
+
+_get_date = attrgetter("date")
+
+
+def _month_rank(item: tuple[str, int]) -> tuple[int, str]:
+    """Sort key for (YYYY-MM, count) pairs: most frequent first, then earliest."""
+    return -item[1], item[0]
+
+
+@lru_cache(maxsize=4096)
+def _format_day_display(ds: str | None) -> str:
+    """Return display like '31 (Sun)' for YYYY-MM-DD; blank for YYYY-MM or None."""
+    if not ds:
+        return ""
+    try:
+        if _RE_YMD.fullmatch(ds):
+            # Digits and dashes are already checked: slice straight into date()
+            d = _dt.date(int(ds[:4]), int(ds[5:7]), int(ds[8:]))
+        elif len(ds) == 10:
+            d = _dt.datetime.strptime(ds, "%Y-%m-%d").date()
+        else:
+            return ""
+        return f"{d.day} ({d.strftime('%a')})"
+    except Exception:
+        return ds
+
+
+def _tv_replace_rows(tv: ttk.Treeview, rows) -> list[str]:
+    """Replace every row of tv with rows (iterable of value tuples).
+
+    Returns the new item ids in row order. Issues the Tcl delete/insert
+    commands directly: ttk.Treeview.insert re-formats its option dict on
+    every call, which dominates large refreshes.
+    """
+    call, w = tv.tk.call, str(tv)
+    call(w, "delete", tv.get_children())
+    return [call(w, "insert", "", "end", "-values", values) for values in rows]
+
+
+def _income_row(inc) -> tuple:
+    return (inc.name, f"{inc.amount:,.2f}", _format_day_display(inc.date))
+
+
+def _expense_row(exp) -> tuple:
+    return (exp.name, exp.category, f"{exp.amount:,.2f}", _format_day_display(exp.date))
+
+
+_VIEW_ROW_FORMATTERS = {"incomes": _income_row, "expenses": _expense_row}
+# Rows inserted per step when (re)filling the income/expense views
+_VIEW_CHUNK = 500
+
+
 class BudgetApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -57,7 +148,29 @@ class BudgetApp(tk.Tk):
 
         # Internal state
         self._chart_redraw_after = None
+        # Inputs of the last chart drawings, to skip redraws that change nothing
+        self._drawn_bars: tuple | None = None
+        self._drawn_pie: tuple | None = None
+        self._report_after_id = None
+        # Aggregates of self.bm for the report; dropped whenever the entries change
+        self._agg: dict | None = None
+        self._report_built = False
+        # Preferences waiting for _flush_prefs, and what was last written
+        self._prefs_pending: dict | None = None
+        self._prefs_after_id = None
+        self._prefs_written: dict | None = None
+        self._breakdown_rows: list[tuple] = []  # what tv_breakdown currently shows
+        self._breakdown_iids: list[str] = []
+        # Treeview item ids, parallel to bm.incomes / bm.expenses, so adds and
+        # removals touch only the affected rows
+        self._income_iids: list[str] = []
+        self._expense_iids: list[str] = []
+        self._fill_after_id = None
         self._prefs_path = None
+        # Set while a CSV loads on the worker thread; see _set_loading
+        self._loading = False
+        # Buttons that edit or replace the entries, disabled during a load
+        self._edit_buttons: list[ttk.Button] = []
 
         # Tk variables
         self.var_month = tk.StringVar()
@@ -88,6 +201,7 @@ class BudgetApp(tk.Tk):
     def _build_menu(self) -> None:
         m = tk.Menu(self)
         filem = tk.Menu(m, tearoff=0)
+        self._file_menu = filem
         filem.add_command(label="New Budget", command=self.new_budget)
         filem.add_separator()
         filem.add_command(label="Open CSV…", command=self.open_csv, accelerator="Ctrl+O")
@@ -101,7 +215,7 @@ class BudgetApp(tk.Tk):
         # Global shortcuts
         self.bind_all("<Control-o>", lambda e: self.open_csv())
         self.bind_all("<Control-s>", lambda e: self.save_csv())
-        self.bind_all("<F5>", lambda e: self.update_report())
+        self.bind_all("<F5>", lambda e: self._entries_changed())
 
     def _build_toolbar(self) -> None:
         bar = ttk.Frame(self, padding=(8, 6))
@@ -109,11 +223,15 @@ class BudgetApp(tk.Tk):
         e = ttk.Entry(bar, textvariable=self.var_month, width=12)
         e.grid(row=0, column=1, padx=(6, 16))
         e.bind("<FocusOut>", lambda _e: self._on_month_changed())
-        ttk.Button(bar, text="New", command=self.new_budget).grid(row=0, column=2, padx=4)
-        ttk.Button(bar, text="Open CSV…", command=self.open_csv).grid(row=0, column=3, padx=4)
+        btn_new = ttk.Button(bar, text="New", command=self.new_budget)
+        btn_new.grid(row=0, column=2, padx=4)
+        btn_open = ttk.Button(bar, text="Open CSV…", command=self.open_csv)
+        btn_open.grid(row=0, column=3, padx=4)
+        self._edit_buttons += (btn_new, btn_open)
         ttk.Button(bar, text="Save CSV…", command=self.save_csv).grid(row=0, column=4, padx=4)
-        ttk.Button(bar, text="Export Excel…", command=self.export_excel).grid(row=0, column=5, padx=4)
-        ttk.Button(bar, text="Refresh Report", command=self.update_report).grid(row=0, column=6, padx=16)
+        self.btn_export_excel = ttk.Button(bar, text="Export Excel…", command=self.export_excel)
+        self.btn_export_excel.grid(row=0, column=5, padx=4)
+        ttk.Button(bar, text="Refresh Report", command=self._entries_changed).grid(row=0, column=6, padx=16)
         bar.columnconfigure(7, weight=1)
         bar.grid(row=0, column=0, sticky="ew")
 
@@ -126,6 +244,10 @@ class BudgetApp(tk.Tk):
         nb.add(tab_expense, text="Expenses")
         nb.add(tab_report, text="Report")
         nb.grid(row=1, column=0, sticky="nsew")
+        # The Report tab (charts, breakdown table) is built on first visit
+        self._nb = nb
+        self._tab_report = tab_report
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         self.rowconfigure(1, weight=1)
         self.columnconfigure(0, weight=1)
 
@@ -142,7 +264,8 @@ class BudgetApp(tk.Tk):
         self.ent_income_date.grid(row=1, column=2, padx=(0, 4))
         ttk.Button(form, text="Pick…", command=self.pick_income_date).grid(row=1, column=3, padx=(0, 4))
         ttk.Button(form, text="Today", command=self.use_today_income_date).grid(row=1, column=4, padx=(0, 8))
-        ttk.Button(form, text="Add Income", command=self.add_income).grid(row=1, column=5)
+        btn_add = ttk.Button(form, text="Add Income", command=self.add_income)
+        btn_add.grid(row=1, column=5)
         form.grid(row=0, column=0, sticky="w", pady=(0, 8))
         for w in (self.ent_income_name, self.ent_income_amount, self.ent_income_date):
             w.bind("<Return>", lambda e: self.add_income())
@@ -165,8 +288,11 @@ class BudgetApp(tk.Tk):
         self.tv_income.grid(row=1, column=0, sticky="nsew")
         vsb.grid(row=1, column=1, sticky="ns")
         btns = ttk.Frame(tab_income)
-        ttk.Button(btns, text="Remove Selected", command=self.remove_income_selected).grid(row=0, column=0, padx=(0, 8))
-        ttk.Button(btns, text="Clear All", command=self.clear_incomes).grid(row=0, column=1)
+        btn_remove = ttk.Button(btns, text="Remove Selected", command=self.remove_income_selected)
+        btn_remove.grid(row=0, column=0, padx=(0, 8))
+        btn_clear = ttk.Button(btns, text="Clear All", command=self.clear_incomes)
+        btn_clear.grid(row=0, column=1)
+        self._edit_buttons += (btn_add, btn_remove, btn_clear)
         btns.grid(row=2, column=0, pady=8, sticky="w")
         tab_income.columnconfigure(0, weight=1)
         tab_income.rowconfigure(1, weight=1)
@@ -189,7 +315,8 @@ class BudgetApp(tk.Tk):
         self.ent_expense_date.grid(row=1, column=3, padx=(0, 4))
         ttk.Button(form2, text="Pick…", command=self.pick_expense_date).grid(row=1, column=4, padx=(0, 4))
         ttk.Button(form2, text="Today", command=self.use_today_expense_date).grid(row=1, column=5, padx=(0, 8))
-        ttk.Button(form2, text="Add Expense", command=self.add_expense).grid(row=1, column=6)
+        btn_add = ttk.Button(form2, text="Add Expense", command=self.add_expense)
+        btn_add.grid(row=1, column=6)
         form2.grid(row=0, column=0, sticky="w", pady=(0, 8))
         for w in (self.ent_expense_amount, self.ent_expense_date, self.ent_expense_category):
             w.bind("<Return>", lambda e: self.add_expense())
@@ -214,13 +341,22 @@ class BudgetApp(tk.Tk):
         self.tv_expense.grid(row=1, column=0, sticky="nsew")
         vsb2.grid(row=1, column=1, sticky="ns")
         btns2 = ttk.Frame(tab_expense)
-        ttk.Button(btns2, text="Remove Selected", command=self.remove_expense_selected).grid(row=0, column=0, padx=(0, 8))
-        ttk.Button(btns2, text="Clear All", command=self.clear_expenses).grid(row=0, column=1)
+        btn_remove = ttk.Button(btns2, text="Remove Selected", command=self.remove_expense_selected)
+        btn_remove.grid(row=0, column=0, padx=(0, 8))
+        btn_clear = ttk.Button(btns2, text="Clear All", command=self.clear_expenses)
+        btn_clear.grid(row=0, column=1)
+        self._edit_buttons += (btn_add, btn_remove, btn_clear)
         btns2.grid(row=2, column=0, pady=8, sticky="w")
         tab_expense.columnconfigure(0, weight=1)
         tab_expense.rowconfigure(1, weight=1)
 
-        # Report tab
+    def _on_tab_changed(self, _event=None) -> None:
+        if not self._report_built and self._nb.select() == str(self._tab_report):
+            self._build_report_tab(self._tab_report)
+            self._report_built = True
+            self.update_report()
+
+    def _build_report_tab(self, tab_report: ttk.Frame) -> None:
         summary = ttk.LabelFrame(tab_report, text="Summary", padding=8)
         self.lbl_income = ttk.Label(summary, text="Total Income: $0.00")
         self.lbl_expenses = ttk.Label(summary, text="Total Expenses: $0.00")
@@ -284,12 +420,14 @@ class BudgetApp(tk.Tk):
     # Actions
     def _on_month_changed(self) -> None:
         self.bm.month = self.var_month.get().strip() or None
-        self.update_report()
+        self._schedule_report()
         self._save_prefs()
 
     def add_income(self) -> None:
+        if self._loading:
+            return
         name = (self.var_income_name.get() or "Income").strip()
-        amt_str = (self.var_income_amount.get() or "0").replace(",", "").strip()
+        amt_str = (self.var_income_amount.get() or "0").translate(_NO_COMMAS)
         raw_date = (self.var_income_date.get() or "").strip()
         try:
             amt = float(amt_str)
@@ -304,14 +442,16 @@ class BudgetApp(tk.Tk):
             return
         self.bm.add_income(name, amt, norm_date)
         self._clear_income_fields()
-        self.refresh_income_view()
-        self.update_report()
+        self._append_row(self.tv_income, "incomes", "_income_iids")
+        self._entries_changed()
         self.status.set("Income added.")
 
     def add_expense(self) -> None:
+        if self._loading:
+            return
         name = (self.var_expense_name.get() or "Expense").strip()
         category = (self.var_expense_category.get() or "Uncategorized").strip()
-        amt_str = (self.var_expense_amount.get() or "0").replace(",", "").strip()
+        amt_str = (self.var_expense_amount.get() or "0").translate(_NO_COMMAS)
         raw_date = (self.var_expense_date.get() or "").strip()
         try:
             amt = float(amt_str)
@@ -326,8 +466,8 @@ class BudgetApp(tk.Tk):
             return
         self.bm.add_expense(name, amt, category, norm_date)
         self._clear_expense_fields()
-        self.refresh_expense_view()
-        self.update_report()
+        self._append_row(self.tv_expense, "expenses", "_expense_iids")
+        self._entries_changed()
         self.status.set("Expense added.")
 
     def _clear_income_fields(self) -> None:
@@ -342,38 +482,41 @@ class BudgetApp(tk.Tk):
         self.var_expense_date.set("")
 
     def remove_income_selected(self) -> None:
-        sel = list(self.tv_income.selection())
-        if not sel:
-            return
-        indices = sorted((self.tv_income.index(i) for i in sel), reverse=True)
-        for idx in indices:
-            if 0 <= idx < len(self.bm.incomes):
-                del self.bm.incomes[idx]
-        self.refresh_income_view()
-        self.update_report()
-        self.status.set("Income removed.")
+        if self._remove_selected(self.tv_income, "incomes", "_income_iids"):
+            self._entries_changed()
+            self.status.set("Income removed.")
 
     def remove_expense_selected(self) -> None:
-        sel = list(self.tv_expense.selection())
+        if self._remove_selected(self.tv_expense, "expenses", "_expense_iids"):
+            self._entries_changed()
+            self.status.set("Expense removed.")
+
+    def _remove_selected(self, tv: ttk.Treeview, data_attr: str, iids_attr: str) -> bool:
+        sel = tv.selection()
         if not sel:
-            return
-        indices = sorted((self.tv_expense.index(i) for i in sel), reverse=True)
-        for idx in indices:
-            if 0 <= idx < len(self.bm.expenses):
-                del self.bm.expenses[idx]
-        self.refresh_expense_view()
-        self.update_report()
-        self.status.set("Expense removed.")
+            return False
+        data = getattr(self.bm, data_attr)
+        iids = getattr(self, iids_attr)
+        if len(iids) > len(data):
+            # View out of step with the data; resync instead of guessing
+            self._refresh_view(tv, data_attr, iids_attr)
+            return False
+        # iids[i] shows data[i]; entries past len(iids) are still waiting for
+        # _fill_views and are kept as they are.
+        drop = set(sel)
+        keep = [i for i, iid in enumerate(iids) if iid not in drop]
+        setattr(self.bm, data_attr, [data[i] for i in keep] + data[len(iids):])
+        setattr(self, iids_attr, [iids[i] for i in keep])
+        tv.delete(*sel)
+        return True
 
     # Date helpers
     def _open_calendar(self, target_var: tk.StringVar) -> None:
         base = (self.var_month.get() or "").strip()
-        today = _dt.date.today()
-        year = today.year
-        month = today.month
-        if _valid_ym(base):
-            year = int(base[:4])
-            month = int(base[5:7])
+        if not _valid_ym(base):
+            base = _today_ym()
+        year = int(base[:4])
+        month = int(base[5:7])
         sel = _CalendarPopup(self, year, month).show()
         if sel:
             target_var.set(sel)
@@ -385,18 +528,13 @@ class BudgetApp(tk.Tk):
         self._open_calendar(self.var_expense_date)
 
     def use_today_income_date(self) -> None:
-        self.var_income_date.set(_dt.date.today().strftime("%Y-%m-%d"))
+        self.var_income_date.set(_today_ymd())
 
     def use_today_expense_date(self) -> None:
-        self.var_expense_date.set(_dt.date.today().strftime("%Y-%m-%d"))
+        self.var_expense_date.set(_today_ymd())
 
     def pick_category(self) -> None:
-        cats = [
-            "Food", "Rent", "Fuel", "Electricity", "Internet", "Water", "Transport",
-            "Healthcare", "Entertainment", "Education", "Clothing", "Savings",
-            "Debt", "Subscriptions", "Gifts", "Misc"
-        ]
-        sel = _CategoryPicker(self, cats).show()
+        sel = _CategoryPicker(self, _DEFAULT_CATEGORIES).show()
         if sel:
             self.var_expense_category.set(sel)
 
@@ -404,14 +542,14 @@ class BudgetApp(tk.Tk):
         if messagebox.askyesno("Clear incomes", "Remove all income entries?"):
             self.bm.incomes.clear()
             self.refresh_income_view()
-            self.update_report()
+            self._entries_changed()
             self.status.set("All incomes cleared.")
 
     def clear_expenses(self) -> None:
         if messagebox.askyesno("Clear expenses", "Remove all expense entries?"):
             self.bm.expenses.clear()
             self.refresh_expense_view()
-            self.update_report()
+            self._entries_changed()
             self.status.set("All expenses cleared.")
 
     def new_budget(self) -> None:
@@ -421,21 +559,65 @@ class BudgetApp(tk.Tk):
         self.var_month.set("")
         self.refresh_income_view()
         self.refresh_expense_view()
-        self.update_report()
+        self._entries_changed()
         self.status.set("New budget created.")
 
     # File ops
     def open_csv(self) -> None:
+        if self._loading:
+            return
         path = filedialog.askopenfilename(title="Open CSV", filetypes=[["CSV files", "*.csv"], ["All files", "*.*"]])
         if not path:
             return
+        # Parse off the Tk thread; the worker only touches the queue and the
+        # result is applied from _poll_csv_load on the main loop.
+        result: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._load_csv_worker, args=(Path(path), result), daemon=True).start()
+        self._set_loading(True)
+        self.status.set(f"Loading {os.path.basename(path)}…")
+        self.after(50, self._poll_csv_load, path, result)
+
+    @staticmethod
+    def _load_csv_worker(path: Path, result: queue.Queue) -> None:
         try:
-            incomes, expenses = read_csv(Path(path))
+            incomes, expenses = read_csv(path)
+            loaded = BudgetMonth(incomes=incomes, expenses=expenses)
+            # Compute the report here so the refresh after loading is a lookup
+            result.put((loaded, loaded.summary(), None))
         except Exception as exc:
+            result.put((None, None, exc))
+
+    def _poll_csv_load(self, path: str, result: queue.Queue) -> None:
+        try:
+            loaded, agg, exc = result.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_csv_load, path, result)
+            return
+        self._set_loading(False)
+        if exc is not None:
+            self.status.set("Ready")
             messagebox.showerror("Failed to open CSV", str(exc))
             return
-        self.bm.incomes = list(incomes)
-        self.bm.expenses = list(expenses)
+        self._apply_loaded(path, loaded, agg)
+
+    def _set_loading(self, loading: bool) -> None:
+        # The load replaces self.bm when it finishes, so entries added or
+        # removed meanwhile would be lost; a second Open would race the first.
+        # Key bindings reach add_*/open_csv directly, which check the flag.
+        self._loading = loading
+        flag = ["disabled"] if loading else ["!disabled"]
+        for b in self._edit_buttons:
+            b.state(flag)
+        menu_state = "disabled" if loading else "normal"
+        for label in ("New Budget", "Open CSV…"):
+            self._file_menu.entryconfigure(label, state=menu_state)
+
+    def _apply_loaded(self, path: str, loaded: BudgetMonth, agg: dict) -> None:
+        # Adopt the worker's BudgetMonth as is: read_csv's lists are fresh and
+        # agg is its report, already computed.
+        loaded.month = self.bm.month
+        self.bm = loaded
+        self._agg = agg
         inferred = self._infer_month_from_entries()
         if inferred:
             self.var_month.set(inferred)
@@ -443,7 +625,7 @@ class BudgetApp(tk.Tk):
             self._save_prefs()
         self.refresh_income_view()
         self.refresh_expense_view()
-        self.update_report()
+        self._schedule_report()
         self.status.set(f"Loaded {os.path.basename(path)}")
 
     def save_csv(self) -> None:
@@ -456,13 +638,16 @@ class BudgetApp(tk.Tk):
         if not path:
             return
         try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
+            # 1 MiB buffer: large budgets flush in a few big writes, not per 8 KiB
+            with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
                 w = csv.writer(f)
                 w.writerow(["type", "name", "category", "amount", "date"])  # date = YYYY-MM or YYYY-MM-DD
-                for inc in self.bm.incomes:
-                    w.writerow(["income", inc.name, "", f"{inc.amount:.2f}", (inc.date or self.bm.month or "")])
-                for exp in self.bm.expenses:
-                    w.writerow(["expense", exp.name, exp.category, f"{exp.amount:.2f}", (exp.date or self.bm.month or "")])
+                month = self.bm.month or ""
+                # writerows drives the row loop (and quoting) from C
+                w.writerows(("income", inc.name, "", f"{inc.amount:.2f}", inc.date or month) for inc in self.bm.incomes)
+                w.writerows(
+                    ("expense", exp.name, exp.category, f"{exp.amount:.2f}", exp.date or month) for exp in self.bm.expenses
+                )
         except Exception as exc:
             messagebox.showerror("Failed to save CSV", str(exc))
             return
@@ -478,9 +663,9 @@ class BudgetApp(tk.Tk):
         if not path:
             return
         try:
-            data = self.bm.to_dict()
-            data["month"] = self.var_month.get().strip() or self.bm.month
-            Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self.bm.month = self.var_month.get().strip() or self.bm.month
+            with open(path, "w", encoding="utf-8") as f:
+                write_json(self.bm, f)
         except Exception as exc:
             messagebox.showerror("Failed to export JSON", str(exc))
             return
@@ -495,287 +680,138 @@ class BudgetApp(tk.Tk):
         )
         if not path:
             return
+        # The worker gets its own BudgetMonth over copies of the entry lists,
+        # so edits made while it runs cannot change the workbook mid-write.
+        snapshot = BudgetMonth(month=self.bm.month, incomes=list(self.bm.incomes), expenses=list(self.bm.expenses))
+        month = self.var_month.get().strip() or self.bm.month or ""
+        result: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._export_excel_worker, args=(path, snapshot, month, result), daemon=True).start()
+        self.btn_export_excel.state(["disabled"])
+        self.status.set(f"Exporting {os.path.basename(path)}…")
+        self.after(50, self._poll_excel_export, path, result)
+
+    @staticmethod
+    def _export_excel_worker(path: str, bm: BudgetMonth, month: str, result: queue.Queue) -> None:
         try:
-            wb = Workbook()
-            # Income sheet
-            ws_income = wb.active
-            ws_income.title = "Income"
-            ws_income.append(["Name", "Amount", "Date", "Day (weekday)"])
-            for cell in ws_income[1]:
-                cell.font = Font(bold=True)
-            for inc in self.bm.incomes:
-                ds = inc.date or (self.var_month.get().strip() or self.bm.month or "")
-                ws_income.append([
-                    inc.name,
-                    float(inc.amount),
-                    ds,
-                    self._format_day_display(ds),
-                ])
-            data_end_income = ws_income.max_row
-            # Totals row
-            ws_income.append(["Total", f"=SUM(B2:B{data_end_income})", "", ""])
-            tot_row_income = ws_income.max_row
-            ws_income[f"A{tot_row_income}"].font = Font(bold=True)
-            ws_income[f"B{tot_row_income}"].font = Font(bold=True)
-            # Table style (without totals row)
-            income_table = Table(displayName="IncomeTable", ref=f"A1:D{data_end_income}")
-            income_table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium9", showRowStripes=True, showColumnStripes=False)
-            ws_income.add_table(income_table)
-            ws_income.column_dimensions['A'].width = 32
-            ws_income.column_dimensions['B'].width = 14
-            ws_income.column_dimensions['C'].width = 14
-            ws_income.column_dimensions['D'].width = 16
-            for row in ws_income.iter_rows(min_row=2, min_col=2, max_col=2):
-                for cell in row:
-                    cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-                    cell.alignment = Alignment(horizontal="right")
-            # Emphasize totals row
-            thin = Side(style="thin", color="999999")
-            top = Side(style="medium", color="666666")
-            fill_total = PatternFill("solid", fgColor="FFFBEA")
-            for col in (1, 2, 3, 4):
-                c = ws_income.cell(row=tot_row_income, column=col)
-                c.fill = fill_total
-                c.border = Border(top=top, left=thin, right=thin, bottom=thin)
-            # Freeze header
-            ws_income.freeze_panes = "A2"
-
-            # Expenses sheet
-            ws_exp = wb.create_sheet("Expenses")
-            ws_exp.append(["Name", "Category", "Amount", "Date", "Day (weekday)"])
-            for cell in ws_exp[1]:
-                cell.font = Font(bold=True)
-            for exp in self.bm.expenses:
-                ds = exp.date or (self.var_month.get().strip() or self.bm.month or "")
-                ws_exp.append([
-                    exp.name,
-                    exp.category,
-                    float(exp.amount),
-                    ds,
-                    self._format_day_display(ds),
-                ])
-            data_end_exp = ws_exp.max_row
-            ws_exp.append(["Total", "", f"=SUM(C2:C{data_end_exp})", "", ""])
-            tot_row_exp = ws_exp.max_row
-            ws_exp[f"A{tot_row_exp}"].font = Font(bold=True)
-            ws_exp[f"C{tot_row_exp}"].font = Font(bold=True)
-            # Table style (without totals row)
-            exp_table = Table(displayName="ExpensesTable", ref=f"A1:E{data_end_exp}")
-            exp_table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium9", showRowStripes=True, showColumnStripes=False)
-            ws_exp.add_table(exp_table)
-            ws_exp.column_dimensions['A'].width = 30
-            ws_exp.column_dimensions['B'].width = 20
-            ws_exp.column_dimensions['C'].width = 14
-            ws_exp.column_dimensions['D'].width = 14
-            ws_exp.column_dimensions['E'].width = 16
-            for row in ws_exp.iter_rows(min_row=2, min_col=3, max_col=3):
-                for cell in row:
-                    cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-                    cell.alignment = Alignment(horizontal="right")
-            # Emphasize totals row
-            for col in (1, 2, 3, 4, 5):
-                c = ws_exp.cell(row=tot_row_exp, column=col)
-                c.fill = fill_total
-                c.border = Border(top=top, left=thin, right=thin, bottom=thin)
-            # Freeze header
-            ws_exp.freeze_panes = "A2"
-
-            # Report sheet
-            ws_rep = wb.create_sheet("Report")
-            month = self.var_month.get().strip() or (self.bm.month or "")
-            ws_rep.append(["Month", month])
-            ws_rep.append(["Total Income", float(self.bm.total_income())])
-            ws_rep.append(["Total Expenses", float(self.bm.total_expenses())])
-            ws_rep.append(["Net (Profit)", float(self.bm.net())])
-            ws_rep.append(["Profit Margin", f"{self.bm.profit_margin():.2f}%"])
-            for r in range(1, 6):
-                ws_rep[f"A{r}"].font = Font(bold=True)
-            ws_rep.column_dimensions['A'].width = 20
-            ws_rep.column_dimensions['B'].width = 20
-            ws_rep["B2"].number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-            ws_rep["B3"].number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-            ws_rep["B4"].number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-            ws_rep.append([])
-            ws_rep.append(["Expense Breakdown by Category"])
-            ws_rep.append(["Category", "Amount", "% of Income", "% of Expenses"])
-            ws_rep[ws_rep.max_row - 0][0].font = Font(bold=True)
-            for cell in ws_rep[ws_rep.max_row]:
-                cell.font = Font(bold=True)
-            by_cat = self.bm.expenses_by_category()
-            p_inc = self.bm.expense_percentages_by_category("income")
-            p_exp = self.bm.expense_percentages_by_category("expenses")
-            start_row = ws_rep.max_row + 1
-            for cat, amt in sorted(by_cat.items()):
-                # Write numeric percentages (0-1) and apply % number format later
-                ws_rep.append([cat, float(amt), (p_inc.get(cat, 0.0) / 100.0), (p_exp.get(cat, 0.0) / 100.0)])
-            end_row = ws_rep.max_row
-            # Amount formatting for the table
-            for row in ws_rep.iter_rows(min_row=start_row, min_col=2, max_col=2):
-                for cell in row:
-                    cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-                    cell.alignment = Alignment(horizontal="right")
-            # Percentage formatting
-            for row in ws_rep.iter_rows(min_row=start_row, min_col=3, max_col=4):
-                for cell in row:
-                    cell.number_format = '0.00%'
-                    cell.alignment = Alignment(horizontal="right")
-            # Table style for breakdown (without totals)
-            header_row = start_row - 1
-            if end_row >= start_row:
-                rep_table = Table(displayName="BreakdownTable", ref=f"A{header_row}:D{end_row}")
-                rep_table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium9", showRowStripes=True, showColumnStripes=False)
-                ws_rep.add_table(rep_table)
-            # Totals row for breakdown
-            ws_rep.append(["Total", f"=SUM(B{start_row}:B{end_row})", "", ""])
-            tot_row_rep = ws_rep.max_row
-            ws_rep[f"A{tot_row_rep}"].font = Font(bold=True)
-            ws_rep[f"B{tot_row_rep}"].font = Font(bold=True)
-            for col in (1, 2, 3, 4):
-                c = ws_rep.cell(row=tot_row_rep, column=col)
-                c.fill = fill_total
-                c.border = Border(top=top, left=thin, right=thin, bottom=thin)
-            # Freeze header of breakdown section
-            ws_rep.freeze_panes = f"A{start_row}"
-
-            # Auto-fit columns for better readability
-            self._excel_autofit_columns(ws_income)
-            self._excel_autofit_columns(ws_exp)
-            # Build charts on Report sheet
-            # Bar: Income vs Expenses (B2, B3)
-            bar = BarChart()
-            bar.title = "Income vs Expenses"
-            bar.style = 10
-            data = Reference(ws_rep, min_col=2, min_row=2, max_row=3)
-            cats = Reference(ws_rep, min_col=1, min_row=2, max_row=3)
-            bar.add_data(data, titles_from_data=False)
-            bar.set_categories(cats)
-            bar.y_axis.title = "Amount"
-            bar.y_axis.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-            bar.width = 18
-            bar.height = 10
-            # Show values on bars
-            bar.dataLabels = DataLabelList()
-            bar.dataLabels.showVal = True
-            bar.legend = None
-            ws_rep.add_chart(bar, "F2")
-
-            # Pie: Expense Categories based on breakdown table (exclude totals row)
-            if 'start_row' in locals():
-                pie = PieChart()
-                pie.title = "Expense Categories"
-                # end_row was defined before totals row append
-                if 'end_row' in locals() and end_row >= start_row:
-                    pdata = Reference(ws_rep, min_col=2, min_row=start_row, max_row=end_row)
-                    pcats = Reference(ws_rep, min_col=1, min_row=start_row, max_row=end_row)
-                    pie.add_data(pdata, titles_from_data=False)
-                    pie.set_categories(pcats)
-                    pie.width = 18
-                    pie.height = 10
-                    # Show percentages on slices
-                    pie.dataLabels = DataLabelList()
-                    pie.dataLabels.showPercent = True
-                    pie.dataLabels.showLeaderLines = True
-                    pie.legend.position = 'r'
-                    # Apply a consistent color palette per slice
-                    palette = [
-                        "4CAF50", "2196F3", "FF9800", "9C27B0", "00BCD4",
-                        "8BC34A", "FFC107", "E91E63", "795548", "607D8B",
-                    ]
-                    if pie.series:
-                        # Build and color data points explicitly; 'Series.points' doesn't exist in openpyxl.
-                        s = pie.series[0]
-                        count = end_row - start_row + 1
-                        s.data_points = []
-                        for i in range(count):
-                            dp = DataPoint(idx=i)
-                            dp.graphicalProperties.solidFill = palette[i % len(palette)]
-                            s.data_points.append(dp)
-                    ws_rep.add_chart(pie, "F16")
-
-            # Conditional formatting: highlight categories > 20% of total expenses
-            try:
-                if 'end_row' in locals() and end_row >= start_row:
-                    high_fill = PatternFill("solid", fgColor="FFECEB")
-                    rng = f"D{start_row}:D{end_row}"
-                    rule = CellIsRule(operator='greaterThan', formula=['0.2'], stopIfTrue=False, fill=high_fill)
-                    ws_rep.conditional_formatting.add(rng, rule)
-            except Exception:
-                pass
-
-            # Auto-fit Report columns after charts
-            self._excel_autofit_columns(ws_rep)
-
-            wb.save(path)
+            _write_excel_report(path, bm, month)
+            result.put(None)
         except Exception as exc:
+            result.put(exc)
+
+    def _poll_excel_export(self, path: str, result: queue.Queue) -> None:
+        try:
+            exc = result.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_excel_export, path, result)
+            return
+        self.btn_export_excel.state(["!disabled"])
+        if exc is not None:
+            self.status.set("Ready")
             messagebox.showerror("Failed to export Excel", str(exc))
             return
         self.status.set(f"Excel saved: {os.path.basename(path)}")
 
-    def _excel_autofit_columns(self, ws) -> None:
-        try:
-            max_widths: dict[int, int] = {}
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value is None:
-                        length = 0
-                    else:
-                        text = str(cell.value)
-                        length = len(text)
-                    col_idx = cell.column if isinstance(cell.column, int) else cell.col_idx
-                    max_widths[col_idx] = max(max_widths.get(col_idx, 0), min(60, length + 2))
-            for col_idx, width in max_widths.items():
-                ws.column_dimensions[get_column_letter(col_idx)].width = max(ws.column_dimensions[get_column_letter(col_idx)].width or 10, width)
-        except Exception:
-            # best effort only
-            pass
-
     # Views
     def refresh_income_view(self) -> None:
-        self.tv_income.delete(*self.tv_income.get_children())
-        for inc in self.bm.incomes:
-            self.tv_income.insert("", "end", values=(inc.name, f"{inc.amount:,.2f}", self._format_day_display(inc.date)))
+        self._refresh_view(self.tv_income, "incomes", "_income_iids")
 
     def refresh_expense_view(self) -> None:
-        self.tv_expense.delete(*self.tv_expense.get_children())
-        for exp in self.bm.expenses:
-            self.tv_expense.insert("", "end", values=(exp.name, exp.category, f"{exp.amount:,.2f}", self._format_day_display(exp.date)))
+        self._refresh_view(self.tv_expense, "expenses", "_expense_iids")
+
+    def _refresh_view(self, tv: ttk.Treeview, data_attr: str, iids_attr: str) -> None:
+        # Show the first screenfuls now; _fill_views appends the rest in
+        # chunks from the event loop so large budgets never freeze the UI.
+        data = getattr(self.bm, data_attr)
+        row = _VIEW_ROW_FORMATTERS[data_attr]
+        setattr(self, iids_attr, _tv_replace_rows(tv, [row(x) for x in data[:_VIEW_CHUNK]]))
+        if len(data) > _VIEW_CHUNK:
+            self._schedule_fill()
+
+    def _schedule_fill(self) -> None:
+        if self._fill_after_id is None:
+            self._fill_after_id = self.after(1, self._fill_views)
+
+    def _fill_views(self) -> None:
+        self._fill_after_id = None
+        pending = False
+        for tv, data_attr, iids_attr in (
+            (self.tv_income, "incomes", "_income_iids"),
+            (self.tv_expense, "expenses", "_expense_iids"),
+        ):
+            data = getattr(self.bm, data_attr)
+            iids = getattr(self, iids_attr)
+            n = len(iids)
+            if n < len(data):
+                row = _VIEW_ROW_FORMATTERS[data_attr]
+                call, w = tv.tk.call, str(tv)
+                iids.extend([call(w, "insert", "", "end", "-values", row(x)) for x in data[n:n + _VIEW_CHUNK]])
+                pending = pending or len(iids) < len(data)
+        if pending:
+            self._schedule_fill()
+
+    def _append_row(self, tv: ttk.Treeview, data_attr: str, iids_attr: str) -> None:
+        # Only the entry just added needs a row
+        data = getattr(self.bm, data_attr)
+        iids = getattr(self, iids_attr)
+        if len(iids) == len(data) - 1:
+            iids.append(tv.insert("", "end", values=_VIEW_ROW_FORMATTERS[data_attr](data[-1])))
+        elif len(iids) < len(data):
+            self._schedule_fill()  # still filling; the new entry is picked up there
+        else:
+            self._refresh_view(tv, data_attr, iids_attr)
 
     def update_report(self) -> None:
         self.bm.month = self.var_month.get().strip() or self.bm.month
-        inc = self.bm.total_income()
-        exp = self.bm.total_expenses()
-        net = self.bm.net()
-        pm = self.bm.profit_margin()
-        self.lbl_income.config(text=f"Total Income: ${inc:,.2f}")
-        self.lbl_expenses.config(text=f"Total Expenses: ${exp:,.2f}")
-        self.lbl_net.config(text=f"Net (Profit): ${net:,.2f}")
-        self.lbl_margin.config(text=f"Profit Margin: {pm:.2f}%")
-        self.tv_breakdown.delete(*self.tv_breakdown.get_children())
-        by_cat = self.bm.expenses_by_category()
-        p_inc = self.bm.expense_percentages_by_category("income")
-        p_exp = self.bm.expense_percentages_by_category("expenses")
-        for cat in sorted(by_cat):
-            amt = by_cat[cat]
-            self.tv_breakdown.insert("", "end", values=(cat, f"{amt:,.2f}", f"{p_inc.get(cat, 0.0):.2f}%", f"{p_exp.get(cat, 0.0):.2f}%"))
-        # Draw charts
-        self._redraw_charts()
-
-    def _redraw_charts(self) -> None:
-        inc = self.bm.total_income()
-        exp = self.bm.total_expenses()
-        by_cat = self.bm.expenses_by_category()
-        self._draw_income_expense_chart(inc, exp)
-        self._draw_category_pie(by_cat)
+        if not self._report_built:
+            return
+        # One snapshot serves the labels, the table and the charts.
+        agg = self._report_snapshot()
+        self.lbl_income.config(text=f"Total Income: ${agg['income']:,.2f}")
+        self.lbl_expenses.config(text=f"Total Expenses: ${agg['expenses']:,.2f}")
+        self.lbl_net.config(text=f"Net (Profit): ${agg['net']:,.2f}")
+        self.lbl_margin.config(text=f"Profit Margin: {agg['profit_margin']:.2f}%")
+        inc_pct = agg["percent_of_income"].get
+        exp_pct = agg["percent_of_expenses"].get
+        rows = [
+            (cat, f"{amt:,.2f}", f"{inc_pct(cat, 0.0):.2f}%", f"{exp_pct(cat, 0.0):.2f}%")
+            for cat, amt in sorted(agg["by_category"].items(), key=_first)
+        ]
+        old = self._breakdown_rows
+        if rows != old:
+            if len(rows) == len(old) and all(r[0] == o[0] for r, o in zip(rows, old)):
+                # Same categories in the same order: only touch the rows that changed
+                call, w = self.tv_breakdown.tk.call, str(self.tv_breakdown)
+                for iid, r, o in zip(self._breakdown_iids, rows, old):
+                    if r != o:
+                        call(w, "item", iid, "-values", r)
+            else:
+                self._breakdown_iids = _tv_replace_rows(self.tv_breakdown, rows)
+            self._breakdown_rows = rows
+        # Draw charts from the same snapshot
+        self._redraw_charts(agg)
+
+    def _redraw_charts(self, agg: dict | None = None) -> None:
+        # Resize redraws come without a snapshot and reuse the current one
+        if agg is None:
+            agg = self._report_snapshot()
+        self._draw_income_expense_chart(agg["income"], agg["expenses"])
+        self._draw_category_pie(agg["by_category"])
 
     def _draw_income_expense_chart(self, income: float, expenses: float) -> None:
         c = self.canvas_income_expense
-        c.delete("all")
         try:
             w = max(1, int(c.winfo_width()))
             h = max(1, int(c.winfo_height()))
         except Exception:
+            c.delete("all")
+            self._drawn_bars = None
             return
+        # Report refreshes that change neither the totals nor the size keep the drawing
+        key = (w, h, income, expenses)
+        if key == self._drawn_bars:
+            return
+        self._drawn_bars = key
+        c.delete("all")
         pad = 24
         usable_h = max(1, h - 2 * pad)
         usable_w = max(1, w - 3 * pad)
@@ -802,31 +838,37 @@ class BudgetApp(tk.Tk):
 
     def _draw_category_pie(self, by_cat: dict[str, float]) -> None:
         c = self.canvas_categories
-        c.delete("all")
         try:
             w = max(1, int(c.winfo_width()))
             h = max(1, int(c.winfo_height()))
         except Exception:
+            c.delete("all")
+            self._drawn_pie = None
             return
+        # by_cat comes from the report snapshot and is never mutated, so it
+        # can be kept for comparison as is.
+        key = (w, h, by_cat)
+        if key == self._drawn_pie:
+            return
+        self._drawn_pie = key
+        c.delete("all")
         pad = 16
         r = max(10, min(w, h) // 2 - pad)
         cx, cy = w // 2, h // 2
-        total = sum(v for v in by_cat.values() if v > 0)
+        # Positive categories by amount desc; the total comes from the same list
+        items = sorted([kv for kv in by_cat.items() if kv[1] > 0], key=_second, reverse=True)
+        total = sum(map(_second, items))
         if total <= 0:
             c.create_text(cx, cy, text="No expenses", fill="#666")
             return
-        # Sort categories by amount desc
-        items = sorted([(k, v) for k, v in by_cat.items() if v > 0], key=lambda kv: kv[1], reverse=True)
         bbox = (cx - r, cy - r, cx + r, cy + r)
-        colors = [
-            "#4caf50", "#2196f3", "#ff9800", "#9c27b0", "#00bcd4",
-            "#8bc34a", "#ffc107", "#e91e63", "#795548", "#607d8b",
-        ]
+        colors = _PIE_COLORS
+        n_colors = len(colors)
         angle = 0.0
         for i, (name, val) in enumerate(items):
             frac = val / total
             extent = frac * 360.0
-            color = colors[i % len(colors)]
+            color = colors[i % n_colors]
             c.create_arc(bbox, start=angle, extent=extent, fill=color, outline="white")
             # Label slices >= 5%
             if frac >= 0.05:
@@ -846,6 +888,27 @@ class BudgetApp(tk.Tk):
             pass
         self._chart_redraw_after = self.after(120, self._redraw_charts)
 
+    def _schedule_report(self) -> None:
+        # Coalesce report refreshes from rapid edits (and held-down F5) into
+        # one at idle time; a pending refresh already sees the latest data.
+        if self._report_after_id is None:
+            self._report_after_id = self.after_idle(self._do_report)
+
+    def _do_report(self) -> None:
+        self._report_after_id = None
+        self.update_report()
+
+    def _entries_changed(self) -> None:
+        # Every edit of self.bm's entries goes through here, so the snapshot
+        # is never read stale.
+        self._agg = None
+        self._schedule_report()
+
+    def _report_snapshot(self) -> dict:
+        if self._agg is None:
+            self._agg = self.bm.summary()
+        return self._agg
+
     # Preferences
     def _load_prefs(self) -> None:
         if not self._prefs_path:
@@ -854,6 +917,7 @@ class BudgetApp(tk.Tk):
             if self._prefs_path.exists():
                 data = json.loads(self._prefs_path.read_text(encoding="utf-8"))
                 month = (data.get("month") or "").strip()
+                self._prefs_written = {"month": month}
                 if month:
                     self.var_month.set(month)
                     self.bm.month = month
@@ -862,11 +926,26 @@ class BudgetApp(tk.Tk):
             pass
 
     def _save_prefs(self) -> None:
+        # Capture the values now (the widgets may be gone by the final flush)
+        # and write them once things settle rather than on every focus-out.
         if not self._prefs_path:
             return
+        self._prefs_pending = {"month": (self.var_month.get() or "").strip()}
+        if self._prefs_after_id is None:
+            self._prefs_after_id = self.after(500, self._flush_prefs)
+
+    def _flush_prefs(self) -> None:
+        self._prefs_after_id = None
+        data, self._prefs_pending = self._prefs_pending, None
+        if data is None or data == self._prefs_written:
+            return
         try:
-            data = {"month": (self.var_month.get() or "").strip()}
-            self._prefs_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # never leaves a truncated prefs file behind.
+            tmp = self._prefs_path.with_name(self._prefs_path.name + ".tmp")
+            tmp.write_bytes(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp, self._prefs_path)
+            self._prefs_written = data
         except Exception:
             pass
 
@@ -875,18 +954,6 @@ class BudgetApp(tk.Tk):
             return messagebox.askyesno("Discard changes", "Discard current entries?")
         return True
 
-    def _format_day_display(self, ds: str | None) -> str:
-        """Return display like '31 (Sun)' for YYYY-MM-DD; blank for YYYY-MM or None."""
-        if not ds:
-            return ""
-        try:
-            if len(ds) == 10:
-                d = _dt.datetime.strptime(ds, "%Y-%m-%d").date()
-                return f"{d.day} ({d.strftime('%a')})"
-            return ""
-        except Exception:
-            return ds
-
     def _normalize_date_input(self, s: str) -> tuple[str | None, str | None]:
         """Normalize user-entered date:
         - Accept YYYY-MM, YYYY-MM-DD, or day-of-month (DD)
@@ -910,49 +977,290 @@ class BudgetApp(tk.Tk):
                 return None, "Day must be between 1 and 31."
             base = (self.var_month.get() or "").strip()
             if not _valid_ym(base):
-                base = _dt.date.today().strftime("%Y-%m")
-            y = int(base[:4])
-            m = int(base[5:7])
-            try:
-                d = _dt.date(y, m, day)
-            except ValueError:
+                base = _today_ym()
+            ds = f"{base}-{day:02d}"
+            if not _valid_ymd(ds):
                 return None, f"Day {day:02d} is not valid for {base}."
-            return d.strftime("%Y-%m-%d"), None
+            return ds, None
         return None, "Enter date as YYYY-MM, YYYY-MM-DD, or day-of-month (DD)."
 
     def _infer_month_from_entries(self) -> str | None:
+        # Entries share few distinct dates: count the raw strings first, then
+        # validate each distinct one once.
+        raw = Counter(map(_get_date, self.bm.incomes))
+        raw.update(map(_get_date, self.bm.expenses))
         counts: dict[str, int] = {}
-        def add_date(ds: str | None) -> None:
-            if not ds:
-                return
-            ym: str | None = None
-            if _valid_ymd(ds):
-                ym = ds[:7]
-            elif _valid_ym(ds):
-                ym = ds
-            if ym:
-                counts[ym] = counts.get(ym, 0) + 1
-        for inc in self.bm.incomes:
-            add_date(getattr(inc, 'date', None))
-        for exp in self.bm.expenses:
-            add_date(getattr(exp, 'date', None))
+        for ds, n in raw.items():
+            m = _RE_YM_PREFIX.fullmatch(ds) if ds else None
+            # A day part still needs the calendar check (e.g. Feb 30)
+            if m and (m.group(2) is None or _valid_ymd(ds)):
+                ym = m.group(1)
+                counts[ym] = counts.get(ym, 0) + n
         if not counts:
             return None
-        # Pick the month with max occurrences; tie-breaker uses lexicographic order (earlier month first)
-        return sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[0][0]
+        # Pick the month with max occurrences; tie-breaker uses lexicographic order (earlier month first).
+        # A single min() pass instead of sorting every candidate.
+        return min(counts.items(), key=_month_rank)[0]
+
+
+@lru_cache(maxsize=None)
+def _xl_styles() -> dict:
+    """The shared export styles, built on the first Excel export.
+
+    openpyxl styles are immutable, so one instance serves every cell and export.
+    """
+    from openpyxl.chart.label import DataLabelList
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side, numbers
+
+    thin = Side(style="thin", color="FF999999")
+    top = Side(style="medium", color="FF666666")
+    return {
+        # Excel cell formats applied as amount cells are written
+        "currency": numbers.FORMAT_CURRENCY_USD_SIMPLE,
+        "right": Alignment(horizontal="right"),
+        "bold": Font(bold=True),
+        "total_fill": PatternFill("solid", fgColor="FFFFFBEA"),
+        "total_border": Border(top=top, left=thin, right=thin, bottom=thin),
+        # Breakdown rows above 20% of expenses (conditional format on the Report sheet)
+        "high_fill": PatternFill("solid", fgColor="FFFFECEB"),
+        # Chart data labels; only read when the workbook is serialized, so shared
+        "bar_labels": DataLabelList(showVal=True),
+        "pie_labels": DataLabelList(showPercent=True, showLeaderLines=True),
+    }
+
+
+def _xl_cell(ws, value, **style):
+    """A write-only cell with the given style attributes (font=..., fill=...)."""
+    from openpyxl.cell import WriteOnlyCell
+
+    c = WriteOnlyCell(ws, value=value)
+    for attr, v in style.items():
+        setattr(c, attr, v)
+    return c
+
+
+def _xl_total_row(ws, values, amount_col: int, styles: dict, amount_format: bool = True) -> list:
+    """A totals row: bold label and amount, shaded and boxed across the whole row.
+
+    Every cell shares the style objects from _xl_styles(), so openpyxl
+    registers each style once per workbook however many sheets carry a
+    totals row.
+    """
+    fill, border, bold = styles["total_fill"], styles["total_border"], styles["bold"]
+    cells = []
+    for col, v in enumerate(values, 1):
+        c = _xl_cell(ws, v, fill=fill, border=border)
+        if col == 1 or col == amount_col:
+            c.font = bold
+        if amount_format and col == amount_col:
+            c.number_format = styles["currency"]
+            c.alignment = styles["right"]
+        cells.append(c)
+    return cells
+
+
+def _xl_add_table(ws, name: str, ref: str, headers) -> None:
+    """Add a banded table over ref. Column names are set up front because a
+    write-only sheet cannot be read back to take them from the header row."""
+    from openpyxl.worksheet.filters import AutoFilter
+    from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+
+    table = Table(displayName=name, ref=ref)
+    table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium9", showRowStripes=True, showColumnStripes=False)
+    table.tableColumns = [TableColumn(id=i, name=h) for i, h in enumerate(headers, 1)]
+    # Header filter dropdowns, as Table._initialise_columns would add
+    table.autoFilter = AutoFilter(ref=ref)
+    with warnings.catch_warnings():
+        # openpyxl warns on every write-only add_table; the columns are set above
+        warnings.filterwarnings("ignore", "In write-only mode")
+        ws.add_table(table)
+
+
+def _xl_set_widths(ws, rows, preset: dict[int, float]) -> None:
+    """Fit column widths to the values about to be written (capped at 60).
+
+    Write-only sheets emit <cols> before the first row, so widths are
+    computed from the row values up front rather than read back afterwards.
+    Rows are measured column by column so that str/len/max run in C; short
+    rows are padded with "" and count as empty.
+    """
+    from openpyxl.utils import get_column_letter
+
+    widths = {
+        i: min(60, max(map(len, map(str, column))) + 2)
+        for i, column in enumerate(zip_longest(*rows, fillvalue=""), 1)
+    }
+    for i in sorted(widths.keys() | preset.keys()):
+        ws.column_dimensions[get_column_letter(i)].width = max(preset.get(i, 13), widths.get(i, 0))
+
+
+def _write_excel_report(path: str, bm: BudgetMonth, month: str) -> None:
+    """Write the Income, Expenses and Report sheets for bm to path.
+
+    Uses openpyxl's write-only mode: rows are streamed to the file as they are
+    appended instead of being kept as Cell objects, and every style is applied
+    on the cell as it is written. month fills in entries without a date and
+    labels the report.
+    """
+    # openpyxl takes a noticeable share of GUI start-up to import, so it is
+    # loaded here, on the export worker thread, instead.
+    from openpyxl import Workbook
+    from openpyxl.chart import BarChart, PieChart, Reference
+    from openpyxl.chart.series import DataPoint
+    from openpyxl.chart.shapes import GraphicalProperties
+    from openpyxl.formatting.rule import CellIsRule
+
+    styles = _xl_styles()
+    bold = styles["bold"]
+    currency = styles["currency"]
+    right = styles["right"]
+    wb = Workbook(write_only=True)
+
+    # Day labels repeat within a month: _format_day_display is memoized, and
+    # bound locally for the row loops below. Amounts are written as stored:
+    # add_income/add_expense and read_csv already coerce them to float.
+    fmt_day = _format_day_display
+
+    # Income sheet
+    ws_income = wb.create_sheet("Income")
+    headers = ("Name", "Amount", "Date", "Day (weekday)")
+    rows = []
+    for inc in bm.incomes:
+        ds = inc.date or month
+        rows.append((inc.name, inc.amount, ds, fmt_day(ds)))
+    data_end_income = len(rows) + 1
+    totals = ("Total", f"=SUM(B2:B{data_end_income})", "", "")
+    _xl_set_widths(ws_income, [headers, *rows, totals], {1: 32, 2: 14, 3: 14, 4: 16})
+    ws_income.freeze_panes = "A2"
+    ws_income.append([_xl_cell(ws_income, h, font=bold) for h in headers])
+    for name, amount, ds, day in rows:
+        ws_income.append((name, _xl_cell(ws_income, amount, number_format=currency, alignment=right), ds, day))
+    ws_income.append(_xl_total_row(ws_income, totals, 2, styles))
+    _xl_add_table(ws_income, "IncomeTable", f"A1:D{data_end_income}", headers)
+
+    # Expenses sheet
+    ws_exp = wb.create_sheet("Expenses")
+    headers = ("Name", "Category", "Amount", "Date", "Day (weekday)")
+    rows = []
+    for exp in bm.expenses:
+        ds = exp.date or month
+        rows.append((exp.name, exp.category, exp.amount, ds, fmt_day(ds)))
+    data_end_exp = len(rows) + 1
+    totals = ("Total", "", f"=SUM(C2:C{data_end_exp})", "", "")
+    _xl_set_widths(ws_exp, [headers, *rows, totals], {1: 30, 2: 20, 3: 14, 4: 14, 5: 16})
+    ws_exp.freeze_panes = "A2"
+    ws_exp.append([_xl_cell(ws_exp, h, font=bold) for h in headers])
+    for name, cat, amount, ds, day in rows:
+        ws_exp.append((name, cat, _xl_cell(ws_exp, amount, number_format=currency, alignment=right), ds, day))
+    ws_exp.append(_xl_total_row(ws_exp, totals, 3, styles))
+    _xl_add_table(ws_exp, "ExpensesTable", f"A1:E{data_end_exp}", headers)
+
+    # Report sheet
+    ws_rep = wb.create_sheet("Report")
+    agg = bm.summary()
+    summary = (
+        ("Month", month),
+        ("Total Income", float(agg["income"])),
+        ("Total Expenses", float(agg["expenses"])),
+        ("Net (Profit)", float(agg["net"])),
+        ("Profit Margin", f"{agg['profit_margin']:.2f}%"),
+    )
+    headers = ("Category", "Amount", "% of Income", "% of Expenses")
+    p_inc = agg["percent_of_income"]
+    p_exp = agg["percent_of_expenses"]
+    # Numeric percentages (0-1) shown through a % number format
+    breakdown = [
+        (cat, amt, p_inc.get(cat, 0.0) / 100.0, p_exp.get(cat, 0.0) / 100.0)
+        for cat, amt in sorted(agg["by_category"].items(), key=_first)
+    ]
+    title_row = ("Expense Breakdown by Category",)
+    start_row = len(summary) + 4  # summary, blank row, title, header
+    end_row = start_row + len(breakdown) - 1
+    totals = ("Total", f"=SUM(B{start_row}:B{end_row})", "", "")
+    _xl_set_widths(ws_rep, [*summary, (), title_row, headers, *breakdown, totals], {1: 20, 2: 20})
+    # Freeze header of breakdown section
+    ws_rep.freeze_panes = f"A{start_row}"
+    for r, (label, value) in enumerate(summary, 1):
+        if 2 <= r <= 4:
+            value = _xl_cell(ws_rep, value, number_format=currency)
+        ws_rep.append((_xl_cell(ws_rep, label, font=bold), value))
+    ws_rep.append(())
+    ws_rep.append(title_row)
+    ws_rep.append([_xl_cell(ws_rep, h, font=bold) for h in headers])
+    for cat, amt, pi, pe in breakdown:
+        ws_rep.append((
+            cat,
+            _xl_cell(ws_rep, amt, number_format=currency, alignment=right),
+            _xl_cell(ws_rep, pi, number_format="0.00%", alignment=right),
+            _xl_cell(ws_rep, pe, number_format="0.00%", alignment=right),
+        ))
+    ws_rep.append(_xl_total_row(ws_rep, totals, 2, styles, amount_format=False))
+    if breakdown:
+        _xl_add_table(ws_rep, "BreakdownTable", f"A{start_row - 1}:D{end_row}", headers)
+
+    # Charts on the Report sheet
+    # Bar: Income vs Expenses (B2, B3)
+    bar = BarChart()
+    bar.title = "Income vs Expenses"
+    bar.style = 10
+    data = Reference(ws_rep, min_col=2, min_row=2, max_row=3)
+    cats = Reference(ws_rep, min_col=1, min_row=2, max_row=3)
+    bar.add_data(data, titles_from_data=False)
+    bar.set_categories(cats)
+    bar.y_axis.title = "Amount"
+    bar.y_axis.number_format = currency
+    bar.width = 18
+    bar.height = 10
+    # Show values on bars
+    bar.dataLabels = styles["bar_labels"]
+    bar.legend = None
+    ws_rep.add_chart(bar, "F2")
+
+    if breakdown:
+        # Pie: Expense Categories based on breakdown table (exclude totals row)
+        pie = PieChart()
+        pie.title = "Expense Categories"
+        pdata = Reference(ws_rep, min_col=2, min_row=start_row, max_row=end_row)
+        pcats = Reference(ws_rep, min_col=1, min_row=start_row, max_row=end_row)
+        pie.add_data(pdata, titles_from_data=False)
+        pie.set_categories(pcats)
+        pie.width = 18
+        pie.height = 10
+        # Show percentages on slices
+        pie.dataLabels = styles["pie_labels"]
+        pie.legend.position = 'r'
+        # Apply a consistent color palette per slice
+        if pie.series:
+            # Build and color data points explicitly; 'Series.points' doesn't exist in openpyxl.
+            palette = _XL_PIE_COLORS
+            n_colors = len(palette)
+            pie.series[0].data_points = [
+                DataPoint(idx=i, spPr=GraphicalProperties(solidFill=palette[i % n_colors]))
+                for i in range(len(breakdown))
+            ]
+        ws_rep.add_chart(pie, "F16")
+
+        # Conditional formatting: highlight categories > 20% of total expenses
+        rule = CellIsRule(operator='greaterThan', formula=['0.2'], stopIfTrue=False, fill=styles["high_fill"])
+        ws_rep.conditional_formatting.add(f"D{start_row}:D{end_row}", rule)
+
+    wb.save(path)
 
 
 def main() -> int:
     app = BudgetApp()
     try:
-        app.var_month.set(_dt.date.today().strftime("%Y-%m"))
+        app.var_month.set(_today_ym())
     except Exception:
         pass
     app.mainloop()
+    app._flush_prefs()  # a change made just before closing may still be pending
     return 0
 
 
 class _CalendarPopup(tk.Toplevel):
+    _CAL = _cal.Calendar(firstweekday=0)
+
     def __init__(self, master: tk.Misc, year: int, month: int) -> None:
         super().__init__(master)
         self.title("Pick a date")
@@ -968,12 +1276,26 @@ class _CalendarPopup(tk.Toplevel):
     def _build(self) -> None:
         hdr = ttk.Frame(self, padding=8)
         ttk.Button(hdr, text="◀", width=3, command=self._prev_month).grid(row=0, column=0)
-        ttk.Label(hdr, text=f"{self._year}-{self._month:02d}", width=10, anchor="center").grid(row=0, column=1, padx=8)
+        self.lbl_title = ttk.Label(hdr, width=10, anchor="center")
+        self.lbl_title.grid(row=0, column=1, padx=8)
         ttk.Button(hdr, text="▶", width=3, command=self._next_month).grid(row=0, column=2)
         hdr.grid(row=0, column=0, sticky="ew")
 
         self.grid_days = ttk.Frame(self, padding=(8, 0))
         self.grid_days.grid(row=1, column=0)
+        for i, wd in enumerate(["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]):
+            ttk.Label(self.grid_days, text=wd, width=4, anchor="center").grid(row=0, column=i, padx=1, pady=2)
+        # One button per cell of a 6-week grid, created once and relabelled on
+        # navigation instead of being destroyed and rebuilt.
+        self._cell_days = [0] * 42
+        self._day_buttons: list[ttk.Button] = []
+        for i in range(42):
+            b = ttk.Button(self.grid_days, width=4, command=lambda i=i: self._on_pick(self._cell_days[i]))
+            b.grid(row=1 + i // 7, column=i % 7, padx=1, pady=1)
+            self._day_buttons.append(b)
+        # Hide all cells in one call; grid remove keeps each slot, so
+        # _render_days can show a cell again with a bare b.grid().
+        self.tk.call("grid", "remove", *(str(b) for b in self._day_buttons))
         self._render_days()
 
         btns = ttk.Frame(self, padding=8)
@@ -981,21 +1303,24 @@ class _CalendarPopup(tk.Toplevel):
         btns.grid(row=2, column=0)
 
     def _render_days(self) -> None:
-        for w in list(self.grid_days.winfo_children()):
-            w.destroy()
-        for i, wd in enumerate(["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]):
-            ttk.Label(self.grid_days, text=wd, width=4, anchor="center").grid(row=0, column=i, padx=1, pady=2)
-        cal = _cal.Calendar(firstweekday=0)
-        row = 1
-        for week in cal.monthdayscalendar(self._year, self._month):
-            for col, day in enumerate(week):
-                if day == 0:
-                    ttk.Label(self.grid_days, text="", width=4).grid(row=row, column=col, padx=1, pady=1)
-                else:
-                    def make_cmd(d=day):
-                        return lambda: self._on_pick(d)
-                    ttk.Button(self.grid_days, text=f"{day:02d}", width=4, command=make_cmd()).grid(row=row, column=col, padx=1, pady=1)
-            row += 1
+        self.lbl_title.configure(text=f"{self._year}-{self._month:02d}")
+        days = [d for week in self._CAL.monthdayscalendar(self._year, self._month) for d in week]
+        days += [0] * (42 - len(days))
+        call = self.tk.call
+        hide = []
+        for b, day, old in zip(self._day_buttons, days, self._cell_days):
+            if day == old:
+                continue
+            if day:
+                call(str(b), "configure", "-text", f"{day:02d}")
+                if not old:
+                    b.grid()
+            else:
+                hide.append(str(b))
+        if hide:
+            # grid remove takes any number of slaves: one Tcl command for all
+            call("grid", "remove", *hide)
+        self._cell_days = days
 
     def _on_pick(self, day: int) -> None:
         d = _dt.date(self._year, self._month, day)
@@ -1007,19 +1332,15 @@ class _CalendarPopup(tk.Toplevel):
         self.destroy()
 
     def _prev_month(self) -> None:
-        if self._month == 1:
-            self._month = 12
-            self._year -= 1
-        else:
-            self._month -= 1
-        self._render_days()
+        self._shift_month(-1)
 
     def _next_month(self) -> None:
-        if self._month == 12:
-            self._month = 1
-            self._year += 1
-        else:
-            self._month += 1
+        self._shift_month(1)
+
+    def _shift_month(self, delta: int) -> None:
+        # Count months from year 0 so divmod handles the year wrap
+        self._year, m0 = divmod(self._year * 12 + self._month - 1 + delta, 12)
+        self._month = m0 + 1
         self._render_days()
 
     def show(self) -> str | None:
@@ -1028,7 +1349,7 @@ class _CalendarPopup(tk.Toplevel):
 
 
 class _CategoryPicker(tk.Toplevel):
-    def __init__(self, master: tk.Misc, categories: list[str]) -> None:
+    def __init__(self, master: tk.Misc, categories: tuple[str, ...]) -> None:
         super().__init__(master)
         self.title("Pick a category")
         self.resizable(False, False)
@@ -1043,8 +1364,7 @@ class _CategoryPicker(tk.Toplevel):
         frm = ttk.Frame(self, padding=8)
         frm.grid(row=0, column=0)
         lb = tk.Listbox(frm, height=min(12, max(6, len(self._cats))), exportselection=False)
-        for c in self._cats:
-            lb.insert(tk.END, c)
+        lb.insert(tk.END, *self._cats)  # one Tcl call for the whole list
         lb.grid(row=0, column=0, sticky="nsew")
         sb = ttk.Scrollbar(frm, orient="vertical", command=lb.yview)
         lb.configure(yscrollcommand=sb.set)
@@ -1,11 +1,17 @@
+import asyncio
 import json
 import io
-import sys
+import os
+import threading
 from datetime import datetime
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
 
 import toga
-from .model import totals, expenses_by_category, parse_amount
+from .model import (
+	category_breakdown, category_of, category_totals, parse_amount, summarize,
+)
 
 
 CATEGORIES = [
@@ -14,15 +20,23 @@ CATEGORIES = [
 	"Debt", "Subscriptions", "Gifts", "Misc", "Uncategorized"
 ]
 
-# File filters for dialogs (backward-compatible)
-# Some Toga mobile backends may not expose FileFilter; fall back to simple patterns.
-if hasattr(toga, "FileFilter"):
-	JSON_FILTER = [toga.FileFilter("JSON", "*.json")]
-	XLSX_FILTER = [toga.FileFilter("Excel Workbook", "*.xlsx")]
-else:
-	# Older backends often accept a list of glob strings.
-	JSON_FILTER = ["*.json", "json"]
-	XLSX_FILTER = ["*.xlsx", "xlsx"]
+# Zero-padded choices for the day and month pickers, built once at import
+_DAY_ITEMS = tuple(f"{i:02d}" for i in range(1, 32))
+_MONTH_ITEMS = tuple(f"{i:02d}" for i in range(1, 13))
+
+# JSON codec: orjson when the platform has a wheel for it, else the stdlib.
+# Both produce/accept compact UTF-8 bytes, so files are interchangeable.
+try:
+	import orjson  # type: ignore
+
+	_json_dumps = orjson.dumps
+	_json_loads = orjson.loads
+except ImportError:
+	def _json_dumps(data) -> bytes:
+		# One-shot dumps without indent runs json's C encoder
+		return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+	_json_loads = json.loads
 
 
 class BudgetMobile(toga.App):
@@ -30,6 +44,12 @@ class BudgetMobile(toga.App):
 		# Data stores
 		self.incomes = []
 		self.expenses = []
+		# Excel engine, resolved on the first export
+		self._excel_engine = None
+		self._excel_mod = None
+		# Visible section; the categories table is only rebuilt while it is Report
+		self._section = "Income"
+		self._categories_stale = False
 		# File meta
 		today = datetime.now()
 		self.meta_year = today.year
@@ -48,7 +68,7 @@ class BudgetMobile(toga.App):
 		# Income tab
 		self.i_name = toga.TextInput(placeholder="e.g. Salary", style=toga.style.Pack())
 		self.i_amount = toga.TextInput(placeholder="e.g. 1200.00", style=toga.style.Pack())
-		self.i_day = toga.Selection(items=[str(i).zfill(2) for i in range(1, 32)], style=toga.style.Pack(width=120))
+		self.i_day = toga.Selection(items=list(_DAY_ITEMS), style=toga.style.Pack(width=120))
 		self.i_today = toga.Button("Today", on_press=self.use_today_income_day, style=toga.style.Pack(width=100))
 		row_date_income = toga.Box(style=toga.style.Pack(direction=toga.style.pack.ROW, padding_bottom=6))
 		row_date_income.add(toga.Label("Day", style=toga.style.Pack(width=110, padding_right=6)))
@@ -69,7 +89,7 @@ class BudgetMobile(toga.App):
 		self.e_category_select = toga.Selection(items=CATEGORIES, style=toga.style.Pack())
 		self.e_category = toga.TextInput(placeholder="Custom category (optional)", style=toga.style.Pack())
 		self.e_amount = toga.TextInput(placeholder="e.g. 50.00", style=toga.style.Pack())
-		self.e_day = toga.Selection(items=[str(i).zfill(2) for i in range(1, 32)], style=toga.style.Pack(width=120))
+		self.e_day = toga.Selection(items=list(_DAY_ITEMS), style=toga.style.Pack(width=120))
 		self.e_today = toga.Button("Today", on_press=self.use_today_expense_day, style=toga.style.Pack(width=100))
 		row_date_expense = toga.Box(style=toga.style.Pack(direction=toga.style.pack.ROW, padding_bottom=6))
 		row_date_expense.add(toga.Label("Day", style=toga.style.Pack(width=110, padding_right=6)))
@@ -90,7 +110,7 @@ class BudgetMobile(toga.App):
 		# Report tab
 		# Date controls
 		self.year_input = toga.TextInput(placeholder="YYYY", style=toga.style.Pack())
-		self.month_select = toga.Selection(items=[str(i).zfill(2) for i in range(1, 13)], style=toga.style.Pack(width=120))
+		self.month_select = toga.Selection(items=list(_MONTH_ITEMS), style=toga.style.Pack(width=120))
 		self.today_btn = toga.Button("Today", on_press=self.use_today, style=toga.style.Pack(width=100))
 
 		self.r_income_total = toga.Label("")
@@ -126,7 +146,10 @@ class BudgetMobile(toga.App):
 		self.expense_box = expense_box
 		self.report_box = report_box
 		self.content = toga.Box(style=toga.style.Pack(direction=toga.style.pack.COLUMN, flex=1))
-		self.content.add(self.income_box)
+		# All sections stay in the tree; switch_section() only toggles display
+		self.content.add(self.income_box, self.expense_box, self.report_box)
+		self.expense_box.style.display = "none"
+		self.report_box.style.display = "none"
 
 		# Bottom navigation with icons
 		self.nav_income = toga.Button("💰 Income", on_press=lambda b: self.switch_section("Income"), style=toga.style.Pack(flex=1, padding=6))
@@ -152,17 +175,19 @@ class BudgetMobile(toga.App):
 		self._sync_date_controls()
 		self.update_report()
 		# Default day selections to today
-		today_day = datetime.now().day
-		self.i_day.value = str(today_day).zfill(2)
-		self.e_day.value = str(today_day).zfill(2)
+		self.i_day.value = f"{today.day:02d}"
+		self.e_day.value = f"{today.day:02d}"
 		# Highlight Income tab by default
 		self._highlight_nav("Income")
+		# Import the Excel engine in the background so the first Export does
+		# not pay for it on the UI thread; on_export reuses the cached result.
+		threading.Thread(target=self._resolve_excel_engine, daemon=True).start()
 
 	# Actions
 	def _compose_date(self, day: int | None) -> str | None:
 		if not day:
 			return None
-		return f"{self.meta_year}-{str(self.meta_month).zfill(2)}-{str(day).zfill(2)}"
+		return f"{self.meta_year}-{self.meta_month:02d}-{day:02d}"
 
 	def add_income(self, button):
 		name = (self.i_name.value or "").strip()
@@ -181,7 +206,9 @@ class BudgetMobile(toga.App):
 			self.i_table.data.append([name, f"{amt:.2f}", date_str or ""])
 			self.i_name.value = ""
 			self.i_amount.value = ""
-			self.update_report()
+			# Only the totals move; expense categories are unaffected
+			self._income_total += amt
+			self._refresh_report(categories=False)
 
 	def add_expense(self, button):
 		name = (self.e_name.value or "").strip()
@@ -203,21 +230,53 @@ class BudgetMobile(toga.App):
 			self.e_name.value = ""
 			self.e_category.value = ""
 			self.e_amount.value = ""
-			self.update_report()
+			self._expense_total += amt
+			key = category_of(rec)
+			self._cat_totals[key] = self._cat_totals.get(key, 0.0) + amt
+			self._refresh_report()
 
 	def update_report(self):
-		t = totals(self.incomes, self.expenses)
+		# Full recompute, for when the lists were replaced (open, new, startup);
+		# add_income/add_expense update the running totals instead.
+		# Amounts are already floats (see add_income/add_expense/_deserialize).
+		exp_amounts = [r["amount"] for r in self.expenses]
+		self._income_total = sum(r["amount"] for r in self.incomes)
+		self._expense_total = sum(exp_amounts)
+		self._cat_totals = category_totals(self.expenses, exp_amounts)
+		self._refresh_report()
+
+	def _refresh_report(self, categories: bool = True):
+		t = summarize(self._income_total, self._expense_total)
 		self.r_income_total.text = f"Income Total: {t['income_total']:.2f}"
 		self.r_expense_total.text = f"Expense Total: {t['expense_total']:.2f}"
 		self.r_profit.text = f"Profit: {t['profit']:.2f}"
 		self.r_margin.text = f"Profit Margin: {t['profit_margin']:.2f}%"
-		# Categories table
-		cats = expenses_by_category(self.expenses)
-		self.r_categories.data.clear()
-		for row in cats:
-			self.r_categories.data.append([
-				row["category"], f"{row['amount']:.2f}", f"{row['percent']:.1f}%",
-			])
+		if not categories:
+			return
+		if self._section != "Report":
+			# Nobody can see the table; switch_section() rebuilds it on open
+			self._categories_stale = True
+			return
+		self._render_categories()
+
+	def _render_categories(self):
+		# Categories table; every percentage moves with the expense total
+		self._categories_stale = False
+		self._set_table_rows(self.r_categories, [
+			[row["category"], f"{row['amount']:.2f}", f"{row['percent']:.1f}%"]
+			for row in category_breakdown(self._cat_totals, self._expense_total)
+		])
+
+	@staticmethod
+	def _set_table_rows(table, rows):
+		"""Replace a Table's rows in one assignment so the backend reloads once
+		instead of once per appended row."""
+		try:
+			table.data = rows
+		except AttributeError:
+			table.data.clear()
+			for row in rows:
+				table.data.append(row)
 
 	def _highlight_nav(self, section: str):
 		# Simple highlight: disable active button
@@ -226,26 +285,31 @@ class BudgetMobile(toga.App):
 		self.nav_report.enabled = section != "Report"
 
 	def switch_section(self, section: str):
-		# Swap displayed content based on requested section
-		for child in list(self.content.children):
-			self.content.remove(child)
+		# Show the requested section and hide the others, without touching the
+		# widget tree (remove/add forces a full relayout on mobile backends)
+		if section == self._section:
+			return
 		if section == "Income":
-			self.content.add(self.income_box)
+			shown = self.income_box
 		elif section == "Expenses":
-			self.content.add(self.expense_box)
+			shown = self.expense_box
 		else:
-			self.content.add(self.report_box)
+			section, shown = "Report", self.report_box
+			if self._categories_stale:
+				self._render_categories()
+		self._section = section
+		for box in (self.income_box, self.expense_box, self.report_box):
+			box.style.display = "pack" if box is shown else "none"
 		self._highlight_nav(section)
 
 	# Date helpers
-	def _is_mobile(self) -> bool:
-		# Android reports 'android'; iOS may report 'ios'
-		plat = sys.platform.lower()
-		return plat.startswith("android") or plat == "ios"
-
 	def _sync_date_controls(self):
-		self.year_input.value = str(self.meta_year)
-		self.month_select.value = str(self.meta_month).zfill(2)
+		# Only write values that differ; every write is a native widget update
+		year, month = str(self.meta_year), f"{self.meta_month:02d}"
+		if self.year_input.value != year:
+			self.year_input.value = year
+		if self.month_select.value != month:
+			self.month_select.value = month
 
 	def _read_date_controls(self):
 		try:
@@ -286,33 +350,39 @@ class BudgetMobile(toga.App):
 		self.meta_month = int(meta.get("month", self.meta_month))
 		self.incomes = list(data.get("incomes", []))
 		self.expenses = list(data.get("expenses", []))
-		# Rebuild tables
-		self.i_table.data.clear()
+		# One walk per list: parse each amount once (kept as a float from here
+		# on), build its table row and fold it into the report totals.
+		inc_rows = []
+		inc_total = 0.0
 		for r in self.incomes:
-			self.i_table.data.append([
-				r.get("name", ""),
-				f"{parse_amount(r.get('amount', 0)):.2f}",
-				r.get("date", ""),
-			])
-		self.e_table.data.clear()
+			amt = r["amount"] = parse_amount(r.get("amount", 0))
+			inc_total += amt
+			inc_rows.append([r.get("name", ""), f"{amt:.2f}", r.get("date", "")])
+		exp_rows = []
+		exp_total = 0.0
+		cat_totals = {}
 		for r in self.expenses:
-			self.e_table.data.append([
-				r.get("name", ""),
-				r.get("category", ""),
-				f"{parse_amount(r.get('amount', 0)):.2f}",
-				r.get("date", ""),
-			])
+			amt = r["amount"] = parse_amount(r.get("amount", 0))
+			exp_total += amt
+			key = category_of(r)
+			cat_totals[key] = cat_totals.get(key, 0.0) + amt
+			exp_rows.append([r.get("name", ""), r.get("category", ""), f"{amt:.2f}", r.get("date", "")])
+		self._set_table_rows(self.i_table, inc_rows)
+		self._set_table_rows(self.e_table, exp_rows)
 		self._sync_date_controls()
-		self.update_report()
+		self._income_total = inc_total
+		self._expense_total = exp_total
+		self._cat_totals = cat_totals
+		self._refresh_report()
 
 	def use_today_income_day(self, button):
-		self.i_day.value = str(datetime.now().day).zfill(2)
+		self.i_day.value = f"{datetime.now().day:02d}"
 
 	def use_today_expense_day(self, button):
-		self.e_day.value = str(datetime.now().day).zfill(2)
+		self.e_day.value = f"{datetime.now().day:02d}"
 
 	def _default_filename(self, ext: str) -> str:
-		return f"budget-{self.meta_year}-{str(self.meta_month).zfill(2)}.{ext}"
+		return f"budget-{self.meta_year}-{self.meta_month:02d}.{ext}"
 
 	def _safe_app_path(self, filename: str) -> Path:
 		try:
@@ -322,6 +392,28 @@ class BudgetMobile(toga.App):
 		base.mkdir(parents=True, exist_ok=True)
 		return base / filename
 
+	def _resolve_excel_engine(self):
+		"""Pick XlsxWriter, else openpyxl, once; later exports reuse the result."""
+		if self._excel_engine is not None:
+			return self._excel_engine
+		for name in ("xlsxwriter", "openpyxl"):
+			try:
+				if find_spec(name) is None:
+					continue
+				if name == "xlsxwriter":
+					import xlsxwriter  # type: ignore
+					self._excel_mod = xlsxwriter
+				else:
+					from openpyxl import Workbook  # type: ignore
+					from openpyxl.cell import WriteOnlyCell  # type: ignore
+					from openpyxl.styles import Font, Alignment, PatternFill  # type: ignore
+					self._excel_mod = (Workbook, WriteOnlyCell, Font, Alignment, PatternFill)
+			except Exception:
+				continue
+			self._excel_engine = name
+			break
+		return self._excel_engine
+
 	def _first_selection(self, sel):
 		"""Normalize dialog return to a single selection (str or Document-like).
 		Accepts str, list/tuple of items, or an object with open()/path attributes.
@@ -332,83 +424,20 @@ class BudgetMobile(toga.App):
 			return sel[0] if sel else None
 		return sel
 
-	def _is_canceled(self, sel) -> bool:
-		# Be explicit: only treat None or empty string/list as canceled; custom
-		# objects from Android SAF should be considered valid even if falsy.
-		if sel is None:
-			return True
-		if isinstance(sel, (list, tuple)) and len(sel) == 0:
-			return True
-		if isinstance(sel, str) and sel.strip() == "":
-			return True
-		return False
-
-	def _ensure_ext(self, path: str, ext: str) -> str:
-		# Ensure path ends with .ext (ext should include dot, e.g. ".json")
-		low = path.lower()
-		if not low.endswith(ext.lower()):
-			return path + ext
-		return path
-
-	# Dialog helpers which retry without filters if the platform rejects them
-	async def _open_json_dialog(self, title: str):
-		# Try with filters and multiselect flag; progressively relax on TypeError
-		try:
-			return await self.main_window.open_file_dialog(
-				title,
-				multiselect=False,
-				file_types=JSON_FILTER,
-			)
-		except TypeError:
-			try:
-				return await self.main_window.open_file_dialog(title, multiselect=False)
-			except TypeError:
-				try:
-					return await self.main_window.open_file_dialog(title, file_types=JSON_FILTER)
-				except TypeError:
-					return await self.main_window.open_file_dialog(title)
-
-	async def _save_json_dialog(self, title: str, suggested: str):
-		# Try with filters and suggested name; progressively relax on TypeError
-		try:
-			return await self.main_window.save_file_dialog(
-				title,
-				suggested_filename=suggested,
-				file_types=JSON_FILTER,
-			)
-		except TypeError:
-			try:
-				return await self.main_window.save_file_dialog(title, suggested_filename=suggested)
-			except TypeError:
-				try:
-					# Some backends may use 'filename' instead
-					return await self.main_window.save_file_dialog(title, filename=suggested)
-				except TypeError:
-					return await self.main_window.save_file_dialog(title)
-
-	async def _save_xlsx_dialog(self, title: str, suggested: str):
-		# Try with filters and suggested name; progressively relax on TypeError
-		try:
-			return await self.main_window.save_file_dialog(
-				title,
-				suggested_filename=suggested,
-				file_types=XLSX_FILTER,
-			)
-		except TypeError:
-			try:
-				return await self.main_window.save_file_dialog(title, suggested_filename=suggested)
-			except TypeError:
-				try:
-					return await self.main_window.save_file_dialog(title, filename=suggested)
-				except TypeError:
-					return await self.main_window.save_file_dialog(title)
-
-	async def _confirm(self, title: str, message: str) -> bool:
-		try:
-			# Toga confirm dialog returns True/False
-			return await self.main_window.confirm_dialog(title, message)
-		except Exception:
-			return False
+	def _resolve_target(self, sel, ext: str):
+		"""Resolve a dialog result once into ``(opener, path)``.
+
+		``opener(mode, **kw)`` opens the selection; ``path`` is its filesystem
+		path, or None for a Document-like object that brings its own open().
+		An empty selection falls back to the default file in app storage.
+		"""
+		sel = self._first_selection(sel)
+		if not sel:
+			sel = self._safe_app_path(self._default_filename(ext))
+		if isinstance(sel, (str, os.PathLike)):
+			path = str(sel)
+			return partial(open, path), path
+		return sel.open, None
 
 	async def on_save(self, button):
 		try:
@@ -418,21 +447,12 @@ class BudgetMobile(toga.App):
 				suggested_filename=self._default_filename("json"),
 				file_types=None,
 			)
-			sel = self._first_selection(sel)
-			if not sel:
-				# Auto fallback to app storage default path
-				sel = str(self._safe_app_path(self._default_filename("json")))
-			data = self._serialize()
-			# If the selection is a Document-like object, use its open() method
-			if hasattr(sel, "open"):
-				with sel.open("w", encoding="utf-8") as f:
-					json.dump(data, f, ensure_ascii=False, indent=2)
-				self.status_label.text = "Saved"
-			else:
-				path = str(sel)
-				with open(path, "w", encoding="utf-8") as f:
-					json.dump(data, f, ensure_ascii=False, indent=2)
-				self.status_label.text = f"Saved: {path}"
+			opener, path = self._resolve_target(sel, "json")
+			# Encoded in one call, written in one call
+			payload = _json_dumps(self._serialize())
+			with opener("wb") as f:
+				f.write(payload)
+			self.status_label.text = f"Saved: {path}" if path else "Saved"
 		except Exception as e:
 			self.status_label.text = f"Save failed: {e}"
 
@@ -444,17 +464,10 @@ class BudgetMobile(toga.App):
 				multiselect=False,
 				file_types=None,
 			)
-			sel = self._first_selection(sel)
-			if not sel:
-				# Auto fallback to default file in app storage
-				sel = str(self._safe_app_path(self._default_filename("json")))
-			if hasattr(sel, "open"):
-				with sel.open("r", encoding="utf-8") as f:
-					data = json.load(f)
-			else:
-				path = str(sel)
-				with open(path, "r", encoding="utf-8") as f:
-					data = json.load(f)
+			opener, _ = self._resolve_target(sel, "json")
+			# Read the whole file in one call and parse it in one go
+			with opener("rb") as f:
+				data = _json_loads(f.read())
 			self._deserialize(data)
 			self.status_label.text = "Opened"
 		except FileNotFoundError:
@@ -465,20 +478,7 @@ class BudgetMobile(toga.App):
 	async def on_export(self, button):
 		try:
 			# Try XlsxWriter first (pure-Python), then openpyxl
-			engine = None
-			try:
-				import xlsxwriter  # type: ignore
-				engine = "xlsxwriter"
-			except Exception:
-				pass
-			if engine is None:
-				try:
-					from openpyxl import Workbook  # type: ignore
-					from openpyxl.utils import get_column_letter  # type: ignore
-					from openpyxl.styles import Font, Alignment, PatternFill  # type: ignore
-					engine = "openpyxl"
-				except Exception:
-					engine = None
+			engine = self._resolve_excel_engine()
 			if engine is None:
 				self.status_label.text = "Export failed: No Excel engine (install XlsxWriter or openpyxl)"
 				return
@@ -489,130 +489,146 @@ class BudgetMobile(toga.App):
 				suggested_filename=self._default_filename("xlsx"),
 				file_types=None,
 			)
-			sel = self._first_selection(sel)
-			if not sel:
-				# Auto fallback to app storage
-				sel = str(self._safe_app_path(self._default_filename("xlsx")))
-
-			if engine == "xlsxwriter":
-				# Build workbook with XlsxWriter
-				import xlsxwriter  # type: ignore
-				buffer = io.BytesIO()
-				wb = xlsxwriter.Workbook(buffer, {"in_memory": True})
-				fmt_bold = wb.add_format({"bold": True})
-				fmt_hdr = wb.add_format({"bold": True, "bg_color": "#DDDDDD", "align": "center"})
-				# Summary
-				sum_ws = wb.add_worksheet("Summary")
-				sum_ws.write_row(0, 0, ["Year", self.meta_year], fmt_bold)
-				sum_ws.write_row(1, 0, ["Month", self.meta_month])
-				sum_ws.write(2, 0, "")
-				t = totals(self.incomes, self.expenses)
-				sum_ws.write_row(3, 0, ["Income Total", t["income_total"]])
-				sum_ws.write_row(4, 0, ["Expense Total", t["expense_total"]])
-				sum_ws.write_row(5, 0, ["Profit", t["profit"]])
-				sum_ws.write_row(6, 0, ["Profit Margin %", t["profit_margin"]])
-				sum_ws.set_column(0, 1, 20)
-				# Incomes
-				inc = wb.add_worksheet("Incomes")
-				inc.write_row(0, 0, ["Name", "Amount", "Date"], fmt_hdr)
-				rowi = 1
-				for r in self.incomes:
-					inc.write_row(rowi, 0, [r.get("name", ""), parse_amount(r.get("amount", 0)), r.get("date", "")])
-					rowi += 1
-				inc.set_column(0, 0, 30)
-				inc.set_column(1, 1, 15)
-				inc.set_column(2, 2, 15)
-				# Expenses
-				exp = wb.add_worksheet("Expenses")
-				exp.write_row(0, 0, ["Name", "Category", "Amount", "Date"], fmt_hdr)
-				rowe = 1
-				for r in self.expenses:
-					exp.write_row(rowe, 0, [r.get("name", ""), r.get("category", ""), parse_amount(r.get("amount", 0)), r.get("date", "")])
-					rowe += 1
-				exp.set_column(0, 0, 30)
-				exp.set_column(1, 1, 20)
-				exp.set_column(2, 2, 15)
-				exp.set_column(3, 3, 15)
-				# Categories
-				cat = wb.add_worksheet("Categories")
-				cat.write_row(0, 0, ["Category", "Amount", "Percent"], fmt_hdr)
-				rowc = 1
-				for row in expenses_by_category(self.expenses):
-					cat.write_row(rowc, 0, [row["category"], row["amount"], row["percent"]])
-					rowc += 1
-				cat.set_column(0, 2, 20)
-				wb.close()
-				data_bytes = buffer.getvalue()
-			else:
-				# Build workbook with openpyxl
-				from openpyxl import Workbook
-				from openpyxl.utils import get_column_letter
-				from openpyxl.styles import Font, Alignment, PatternFill
-				wb = Workbook()
-				ws = wb.active
-				ws.title = "Summary"
-				ws.append(["Year", self.meta_year])
-				ws.append(["Month", self.meta_month])
-				ws.append([])
-				t = totals(self.incomes, self.expenses)
-				ws.append(["Income Total", t["income_total"]])
-				ws.append(["Expense Total", t["expense_total"]])
-				ws.append(["Profit", t["profit"]])
-				ws.append(["Profit Margin %", t["profit_margin"]])
-				for col in range(1, 3):
-					ws.column_dimensions[get_column_letter(col)].width = 20
-				for cell in ws[1]:
-					cell.font = Font(bold=True)
-				inc = wb.create_sheet("Incomes")
-				inc.append(["Name", "Amount", "Date"])
-				for c in inc[1]:
-					c.font = Font(bold=True)
-					c.fill = PatternFill("solid", fgColor="DDDDDD")
-					c.alignment = Alignment(horizontal="center")
-				for r in self.incomes:
-					inc.append([r.get("name", ""), parse_amount(r.get("amount", 0)), r.get("date", "")])
-				inc.column_dimensions['A'].width = 30
-				inc.column_dimensions['B'].width = 15
-				inc.column_dimensions['C'].width = 15
-				exp = wb.create_sheet("Expenses")
-				exp.append(["Name", "Category", "Amount", "Date"])
-				for c in exp[1]:
-					c.font = Font(bold=True)
-					c.fill = PatternFill("solid", fgColor="DDDDDD")
-					c.alignment = Alignment(horizontal="center")
-				for r in self.expenses:
-					exp.append([r.get("name", ""), r.get("category", ""), parse_amount(r.get("amount", 0)), r.get("date", "")])
-				exp.column_dimensions['A'].width = 30
-				exp.column_dimensions['B'].width = 20
-				exp.column_dimensions['C'].width = 15
-				exp.column_dimensions['D'].width = 15
-				cat = wb.create_sheet("Categories")
-				cat.append(["Category", "Amount", "Percent"])
-				for c in cat[1]:
-					c.font = Font(bold=True)
-					c.fill = PatternFill("solid", fgColor="DDDDDD")
-					c.alignment = Alignment(horizontal="center")
-				for row in expenses_by_category(self.expenses):
-					cat.append([row["category"], row["amount"], row["percent"]])
-				for col in ('A','B','C'):
-					cat.column_dimensions[col].width = 20
-				buffer = io.BytesIO()
-				wb.save(buffer)
-				data_bytes = buffer.getvalue()
-
-			# Write bytes to target selection or fallback path
-			if hasattr(sel, "open"):
-				with sel.open("wb") as f:
-					f.write(data_bytes)
+			opener, path = self._resolve_target(sel, "xlsx")
+
+			# The report's running totals are always current, so the summary and
+			# category sheets reuse them instead of walking the records again.
+			t = summarize(self._income_total, self._expense_total)
+			cat_rows = category_breakdown(self._cat_totals, self._expense_total)
+
+			# A plain path is written straight to disk by the engine; only a
+			# Document-like selection needs the workbook buffered in memory.
+			target = path if path is not None else io.BytesIO()
+
+			# Build and write the workbook off the UI thread. The records are
+			# snapshotted so adds during the export do not change what is written.
+			await asyncio.to_thread(
+				self._build_workbook, engine, target, self.meta_year, self.meta_month,
+				t, cat_rows, list(self.incomes), list(self.expenses),
+			)
+
+			if path is None:
+				with opener("wb") as f:
+					f.write(target.getbuffer())
 				self.status_label.text = "Exported"
 			else:
-				path = str(sel) if sel else str(self._safe_app_path(self._default_filename("xlsx")))
-				with open(path, "wb") as f:
-					f.write(data_bytes)
 				self.status_label.text = f"Exported: {path}"
 		except Exception as e:
 			self.status_label.text = f"Export failed: {e}"
 
+	def _build_workbook(self, engine, target, year, month, t, cat_rows, incomes, expenses):
+		"""Write the export workbook to ``target`` (a path or a BytesIO).
+
+		Runs in a worker thread, so it only touches its arguments and the cached
+		engine module.
+		"""
+		inc_amounts = [r["amount"] for r in incomes]
+		exp_amounts = [r["amount"] for r in expenses]
+		if engine == "xlsxwriter":
+			# Build workbook with XlsxWriter
+			xlsxwriter = self._excel_mod
+			wb = xlsxwriter.Workbook(target, {"in_memory": True})
+			fmt_bold = wb.add_format({"bold": True})
+			fmt_hdr = wb.add_format({"bold": True, "bg_color": "#DDDDDD", "align": "center"})
+			# Summary
+			sum_ws = wb.add_worksheet("Summary")
+			sum_ws.write_row(0, 0, ["Year", year], fmt_bold)
+			sum_ws.write_row(1, 0, ["Month", month])
+			sum_ws.write(2, 0, "")
+			sum_ws.write_row(3, 0, ["Income Total", t["income_total"]])
+			sum_ws.write_row(4, 0, ["Expense Total", t["expense_total"]])
+			sum_ws.write_row(5, 0, ["Profit", t["profit"]])
+			sum_ws.write_row(6, 0, ["Profit Margin %", t["profit_margin"]])
+			sum_ws.set_column(0, 1, 20)
+			# Incomes
+			inc = wb.add_worksheet("Incomes")
+			inc.write_row(0, 0, ["Name", "Amount", "Date"], fmt_hdr)
+			# Column-at-a-time: one write_column() per field instead of a
+			# write_row() call per record
+			inc.write_column(1, 0, [r.get("name", "") for r in incomes])
+			inc.write_column(1, 1, inc_amounts)
+			inc.write_column(1, 2, [r.get("date", "") for r in incomes])
+			inc.set_column(0, 0, 30)
+			inc.set_column(1, 1, 15)
+			inc.set_column(2, 2, 15)
+			# Expenses
+			exp = wb.add_worksheet("Expenses")
+			exp.write_row(0, 0, ["Name", "Category", "Amount", "Date"], fmt_hdr)
+			exp.write_column(1, 0, [r.get("name", "") for r in expenses])
+			exp.write_column(1, 1, [r.get("category", "") for r in expenses])
+			exp.write_column(1, 2, exp_amounts)
+			exp.write_column(1, 3, [r.get("date", "") for r in expenses])
+			exp.set_column(0, 0, 30)
+			exp.set_column(1, 1, 20)
+			exp.set_column(2, 2, 15)
+			exp.set_column(3, 3, 15)
+			# Categories
+			cat = wb.add_worksheet("Categories")
+			cat.write_row(0, 0, ["Category", "Amount", "Percent"], fmt_hdr)
+			write_row = cat.write_row
+			for rowc, row in enumerate(cat_rows, 1):
+				write_row(rowc, 0, [row["category"], row["amount"], row["percent"]])
+			cat.set_column(0, 2, 20)
+			wb.close()
+		else:
+			# Build workbook with openpyxl in write-only mode: rows stream out
+			# as they are appended instead of being kept as cell objects.
+			# Column widths must be set before a sheet's first row.
+			Workbook, WriteOnlyCell, Font, Alignment, PatternFill = self._excel_mod
+			wb = Workbook(write_only=True)
+			bold = Font(bold=True)
+			hdr_fill = PatternFill("solid", fgColor="DDDDDD")
+			center = Alignment(horizontal="center")
+
+			def styled(ws, values, header=True):
+				cells = []
+				for value in values:
+					c = WriteOnlyCell(ws, value=value)
+					c.font = bold
+					if header:
+						c.fill = hdr_fill
+						c.alignment = center
+					cells.append(c)
+				return cells
+
+			ws = wb.create_sheet("Summary")
+			for col in ('A', 'B'):
+				ws.column_dimensions[col].width = 20
+			ws.append(styled(ws, ["Year", year], header=False))
+			ws.append(["Month", month])
+			ws.append([])
+			ws.append(["Income Total", t["income_total"]])
+			ws.append(["Expense Total", t["expense_total"]])
+			ws.append(["Profit", t["profit"]])
+			ws.append(["Profit Margin %", t["profit_margin"]])
+			inc = wb.create_sheet("Incomes")
+			inc.column_dimensions['A'].width = 30
+			inc.column_dimensions['B'].width = 15
+			inc.column_dimensions['C'].width = 15
+			inc.append(styled(inc, ["Name", "Amount", "Date"]))
+			# Bound methods as locals: the per-row loops are the hot part
+			append = inc.append
+			for r, amt in zip(incomes, inc_amounts):
+				get = r.get
+				append([get("name", ""), amt, get("date", "")])
+			exp = wb.create_sheet("Expenses")
+			exp.column_dimensions['A'].width = 30
+			exp.column_dimensions['B'].width = 20
+			exp.column_dimensions['C'].width = 15
+			exp.column_dimensions['D'].width = 15
+			exp.append(styled(exp, ["Name", "Category", "Amount", "Date"]))
+			append = exp.append
+			for r, amt in zip(expenses, exp_amounts):
+				get = r.get
+				append([get("name", ""), get("category", ""), amt, get("date", "")])
+			cat = wb.create_sheet("Categories")
+			for col in ('A', 'B', 'C'):
+				cat.column_dimensions[col].width = 20
+			cat.append(styled(cat, ["Category", "Amount", "Percent"]))
+			for row in cat_rows:
+				cat.append([row["category"], row["amount"], row["percent"]])
+			wb.save(target)
+
 	def on_new(self, button):
 		# Reset to a new monthly report
 		now = datetime.now()
@@ -627,9 +643,13 @@ class BudgetMobile(toga.App):
 		self.e_amount.value = ""
 		self.e_category.value = ""
 		self._sync_date_controls()
-		self.i_day.value = str(now.day).zfill(2)
-		self.e_day.value = str(now.day).zfill(2)
-		self.update_report()
+		self.i_day.value = f"{now.day:02d}"
+		self.e_day.value = f"{now.day:02d}"
+		# Both lists are empty, so the running totals reset without a pass
+		self._income_total = 0.0
+		self._expense_total = 0.0
+		self._cat_totals = {}
+		self._refresh_report()
 		self.status_label.text = "Started new monthly report"
 
 
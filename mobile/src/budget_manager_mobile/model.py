@@ -1,18 +1,26 @@
-from collections import defaultdict
+import sys
 
 
 def parse_amount(value: str) -> float:
+    # Stored amounts are already floats; only text needs str()/strip()/float()
+    if type(value) is float:
+        return value
+    # An empty amount field is common; answer it without raising ValueError
+    if value is None or value == "":
+        return 0.0
     try:
-        if value is None:
-            return 0.0
         return float(str(value).strip())
     except Exception:
         return 0.0
 
 
-def totals(incomes, expenses):
-    inc_total = sum(parse_amount(r.get("amount", 0)) for r in incomes)
-    exp_total = sum(parse_amount(r.get("amount", 0)) for r in expenses)
+def category_of(record) -> str:
+    # Interned, so repeated categories hit the totals dict by identity
+    return sys.intern((record.get("category") or "Uncategorized").strip() or "Uncategorized")
+
+
+def summarize(inc_total: float, exp_total: float):
+    """Profit and margin for already-summed income and expense totals."""
     profit = inc_total - exp_total
     margin = (profit / inc_total * 100.0) if inc_total > 0 else 0.0
     return {
@@ -23,14 +31,41 @@ def totals(incomes, expenses):
     }
 
 
+def amounts_of(records):
+    """Parsed amounts, one per record, for callers that need them repeatedly."""
+    return [parse_amount(r.get("amount", 0)) for r in records]
+
+
+def totals(incomes, expenses):
+    inc_total = sum(parse_amount(r.get("amount", 0)) for r in incomes)
+    exp_total = sum(parse_amount(r.get("amount", 0)) for r in expenses)
+    return summarize(inc_total, exp_total)
+
+
+def category_totals(expenses, amounts=None):
+    """{category: amount}; amounts, if given, are the records' parsed amounts."""
+    if amounts is None:
+        amounts = amounts_of(expenses)
+    by_cat = {}
+    for r, amt in zip(expenses, amounts):
+        key = category_of(r)
+        by_cat[key] = by_cat.get(key, 0.0) + amt
+    return by_cat
+
+
+def category_breakdown(by_cat, total=None):
+    """Rows for a {category: amount} mapping, largest first, with percentages.
+
+    Pass the expense total when it is already known to skip summing by_cat.
+    """
+    if total is None:
+        total = sum(by_cat.values())
+    total = total or 1.0
+    return [
+        {"category": cat, "amount": amt, "percent": (amt / total) * 100.0}
+        for cat, amt in sorted(by_cat.items(), key=lambda kv: (-kv[1], kv[0]))
+    ]
+
+
 def expenses_by_category(expenses):
-    by_cat = defaultdict(float)
-    for r in expenses:
-        cat = (r.get("category") or "Uncategorized").strip() or "Uncategorized"
-        by_cat[cat] += parse_amount(r.get("amount", 0))
-    total = sum(by_cat.values()) or 1.0
-    result = []
-    for cat, amt in sorted(by_cat.items(), key=lambda kv: (-kv[1], kv[0])):
-        pct = (amt / total) * 100.0
-        result.append({"category": cat, "amount": amt, "percent": pct})
-    return result
+    return category_breakdown(category_totals(expenses))
@@ -4,6 +4,7 @@ Unit tests for budget_manager.py — target: ≥80% line coverage.
 Run:
     pytest --cov=budget_manager --cov-report=term-missing tests/
 """
+import gc
 import io
 import json
 import sys
@@ -17,6 +18,8 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from budget_manager import (
     BudgetMonth,
+    Expense,
+    Income,
     _clamp_non_negative,
     _is_valid_ym,
     _is_valid_ymd,
@@ -25,6 +28,8 @@ from budget_manager import (
     parse_args,
     print_report,
     read_csv,
+    summarize_csv,
+    write_json,
 )
 
 # ===========================================================================
@@ -71,6 +76,12 @@ class TestClampNonNegative:
     def test_none_returns_zero(self):
         assert _clamp_non_negative(None) == 0.0  # type: ignore
 
+    def test_nan_clamped_to_zero(self):
+        assert _clamp_non_negative(float("nan")) == 0.0
+
+    def test_overflowing_int_returns_zero(self):
+        assert _clamp_non_negative(10 ** 400) == 0.0
+
 
 # ===========================================================================
 # _round_map
@@ -104,6 +115,8 @@ class TestValidators:
         ("25-08", False),
         ("2025/08", False),
         ("20250-8", False),
+        ("2025-08\n", False),
+        ("\u0662\u0660\u0662\u0665-\u0660\u0668", False),  # Arabic-Indic digits
         ("", False),
     ])
     def test_is_valid_ym(self, s, expected):
@@ -116,8 +129,16 @@ class TestValidators:
         ("2025-08-00", False),
         ("2025-08-32", False),
         ("2025-13-01", False),
+        ("2025-02-29", False),
+        ("2025-02-30", False),
+        ("2024-02-29", True),
+        ("2000-02-29", True),
+        ("1900-02-29", False),
+        ("2025-04-31", False),
+        ("2025-12-31", True),
         ("25-08-15", False),
         ("2025/08/15", False),
+        ("2025-08-0\u00b2", False),  # superscript two: isdigit() but not int()
         ("", False),
     ])
     def test_is_valid_ymd(self, s, expected):
@@ -221,6 +242,85 @@ class TestBudgetMonthCalculations:
         assert pct["Cat"] == 0.0
 
 
+# ===========================================================================
+# BudgetMonth — fused aggregation
+# ===========================================================================
+
+class TestBudgetMonthComputeAll:
+    def test_matches_individual_methods(self):
+        bm = _budget_with_data()
+        agg = bm._compute_all()
+        assert agg["income"] == bm.total_income()
+        assert agg["expenses"] == bm.total_expenses()
+        assert agg["net"] == bm.net()
+        assert agg["profit_margin"] == bm.profit_margin()
+        assert agg["by_category"] == bm.expenses_by_category()
+        assert agg["percent_of_income"] == bm.expense_percentages_by_category("income")
+        assert agg["percent_of_expenses"] == bm.expense_percentages_by_category("expenses")
+
+    def test_empty_budget(self):
+        agg = BudgetMonth()._compute_all()
+        assert agg["income"] == 0.0
+        assert agg["profit_margin"] == 0.0
+        assert agg["by_category"] == {}
+
+    def test_zero_income_percentages(self):
+        bm = BudgetMonth()
+        bm.add_expense("X", 100, "Cat")
+        agg = bm._compute_all()
+        assert agg["percent_of_income"] == {"Cat": 0.0}
+        assert agg["percent_of_expenses"] == {"Cat": 100.0}
+
+
+# ===========================================================================
+# BudgetMonth — aggregates follow the entries
+# ===========================================================================
+
+class TestBudgetMonthFreshTotals:
+    def test_add_updates_totals(self):
+        bm = _budget_with_data()
+        assert bm.total_income() == 6000.0
+        bm.add_income("Bonus", 500)
+        assert bm.total_income() == 6500.0
+        bm.add_expense("Fuel", 50, "Transport")
+        assert bm.expenses_by_category()["Transport"] == 50.0
+
+    def test_direct_list_changes(self):
+        bm = _budget_with_data()
+        assert bm.total_expenses() == 2000.0
+        del bm.expenses[0]
+        assert bm.total_expenses() == 500.0
+        bm.expenses = []
+        assert bm.total_expenses() == 0.0
+
+    def test_same_length_replacement(self):
+        bm = _budget_with_data()
+        assert bm.summary()["expenses"] == 2000.0
+        bm.expenses[0] = Expense("c", 100.0, "Z")
+        agg = bm.summary()
+        assert agg["expenses"] == 600.0
+        assert agg["by_category"]["Z"] == 100.0
+        assert "Housing" not in agg["by_category"]
+
+    def test_pop_then_append(self):
+        bm = _budget_with_data()
+        assert bm.total_income() == 6000.0
+        bm.incomes.pop()
+        bm.incomes.append(Income("Gift", 1.0))
+        assert bm.total_income() == 5001.0
+
+    def test_in_place_edit(self):
+        bm = _budget_with_data()
+        assert bm.total_income() == 6000.0
+        bm.incomes[0].amount = 1000.0
+        assert bm.total_income() == 2000.0
+
+    def test_returned_breakdown_is_a_copy(self):
+        bm = _budget_with_data()
+        bm.expenses_by_category()["Housing"] = 0.0
+        assert bm.expenses_by_category()["Housing"] == 1500.0
+
+
 # ===========================================================================
 # BudgetMonth — to_dict
 # ===========================================================================
@@ -285,6 +385,40 @@ class TestPrintReport:
         print_report(bm, buf)
         assert "Monthly Budget Report" in buf.getvalue()
 
+    def test_defaults_to_current_stdout(self, capsys):
+        bm = _budget_with_data()
+        buf = io.StringIO()
+        print_report(bm, buf)
+        print_report(bm)
+        assert capsys.readouterr().out == buf.getvalue()
+        assert buf.getvalue().endswith("\n")
+
+
+# ===========================================================================
+# write_json
+# ===========================================================================
+
+class TestWriteJson:
+    def _dump(self, bm: BudgetMonth) -> str:
+        buf = io.StringIO()
+        write_json(bm, buf)
+        return buf.getvalue()
+
+    def test_matches_json_dumps_of_to_dict(self):
+        bm = _budget_with_data()
+        bm.add_expense('Caf\u00e9 "latte"', 4.5, "Food\nDrinks")
+        assert self._dump(bm) == json.dumps(bm.to_dict(), indent=2)
+
+    def test_empty_budget(self):
+        bm = BudgetMonth()
+        assert self._dump(bm) == json.dumps(bm.to_dict(), indent=2)
+
+    def test_writes_to_every_stream(self):
+        bm = _budget_with_data()
+        a, b = io.StringIO(), io.StringIO()
+        write_json(bm, a, b)
+        assert a.getvalue() == b.getvalue() == json.dumps(bm.to_dict(), indent=2)
+
 
 # ===========================================================================
 # read_csv
@@ -298,6 +432,26 @@ class TestReadCsv:
         "expense,Groceries,Food,400,2025-08\n"
     )
 
+    def test_restores_gc_state(self, tmp_path):
+        p = _make_csv(tmp_path, self.VALID_CSV)
+        assert gc.isenabled()
+        read_csv(p, pause_gc=True)
+        assert gc.isenabled()
+        gc.disable()
+        try:
+            read_csv(p, pause_gc=True)
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_gc_left_alone_by_default(self, tmp_path, monkeypatch):
+        def fail():
+            raise AssertionError("gc.disable() called")
+
+        monkeypatch.setattr(gc, "disable", fail)
+        incomes, expenses = read_csv(_make_csv(tmp_path, self.VALID_CSV))
+        assert len(incomes) == 1 and len(expenses) == 2
+
     def test_reads_incomes(self, tmp_path):
         p = _make_csv(tmp_path, self.VALID_CSV)
         incomes, _ = read_csv(p)
@@ -329,6 +483,28 @@ class TestReadCsv:
         assert len(incomes) == 0
         assert len(expenses) == 0
 
+    def test_headers_case_insensitive(self, tmp_path):
+        csv_content = (
+            "Type, Name ,Category,AMOUNT\n"
+            "income,Salary,,100\n"
+            " expense ,Rent,Housing,40\n"
+        )
+        p = _make_csv(tmp_path, csv_content)
+        incomes, expenses = read_csv(p)
+        assert incomes[0].name == "Salary"
+        assert expenses[0].category == "Housing"
+
+    def test_type_matched_exactly(self, tmp_path):
+        csv_content = (
+            "type,name,category,amount\n"
+            "Income,Salary,,100\n"
+            "EXPENSE,Rent,Housing,40\n"
+        )
+        p = _make_csv(tmp_path, csv_content)
+        incomes, expenses = read_csv(p)
+        assert incomes == []
+        assert expenses == []
+
     def test_invalid_amount_defaults_to_zero(self, tmp_path):
         csv_content = (
             "type,name,category,amount\n"
@@ -338,6 +514,16 @@ class TestReadCsv:
         incomes, _ = read_csv(p)
         assert incomes[0].amount == 0.0
 
+    def test_blank_and_padded_amounts(self, tmp_path):
+        csv_content = (
+            "type,name,category,amount\n"
+            "income,A,,\n"
+            "income,B,, 12.5 \n"
+        )
+        p = _make_csv(tmp_path, csv_content)
+        incomes, _ = read_csv(p)
+        assert [i.amount for i in incomes] == [0.0, 12.5]
+
     def test_default_expense_category(self, tmp_path):
         csv_content = (
             "type,name,category,amount\n"
@@ -375,6 +561,35 @@ class TestReadCsv:
         assert incomes[0].name == "Income"
 
 
+# ===========================================================================
+# summarize_csv
+# ===========================================================================
+
+class TestSummarizeCsv:
+    def test_matches_full_read(self, tmp_path):
+        p = _make_csv(tmp_path, TestReadCsv.VALID_CSV)
+        incomes, expenses = read_csv(p)
+        bm = BudgetMonth(incomes=incomes, expenses=expenses)
+        assert summarize_csv(p) == bm._compute_all()
+
+    def test_matches_full_read_with_fractional_amounts(self, tmp_path):
+        # Many rows of 0.1 accumulate rounding error; both paths must agree exactly
+        rows = ["type,name,category,amount"]
+        for i in range(3000):
+            rows.append(f"income,I{i},,0.1")
+            rows.append(f"expense,E{i},Cat{i % 3},0.1")
+            rows.append(f"expense,F{i},Cat{i % 7},0.7")
+        p = _make_csv(tmp_path, "\n".join(rows) + "\n")
+        incomes, expenses = read_csv(p)
+        bm = BudgetMonth(incomes=incomes, expenses=expenses)
+        assert summarize_csv(p) == bm._compute_all()
+
+    def test_missing_required_header_raises(self, tmp_path):
+        p = _make_csv(tmp_path, "type,name\nincome,Salary\n")
+        with pytest.raises(ValueError, match="missing required headers"):
+            summarize_csv(p)
+
+
 # ===========================================================================
 # parse_args
 # ===========================================================================
@@ -403,6 +618,10 @@ class TestParseArgs:
         args = parse_args(["--save-json", "out.json"])
         assert args.save_json == "out.json"
 
+    def test_summary_flag(self):
+        assert parse_args([]).summary is False
+        assert parse_args(["--summary"]).summary is True
+
 
 # ===========================================================================
 # main — end-to-end
@@ -459,6 +678,32 @@ class TestMain:
         saved = json.loads(out_path.read_text(encoding="utf-8"))
         assert saved["totals"]["income"] == 3000.0
 
+    def test_summary_json_mode(self, tmp_path, capsys):
+        csv_content = (
+            "type,name,category,amount\n"
+            "income,Salary,,4000\n"
+            "expense,Rent,Housing,1000\n"
+        )
+        p = tmp_path / "budget.csv"
+        p.write_text(csv_content, encoding="utf-8")
+        out_path = tmp_path / "report.json"
+        ret = main(["--input", str(p), "--summary", "--json", "--save-json", str(out_path)])
+        assert ret == 0
+        data = json.loads(capsys.readouterr().out)
+        assert data["totals"]["net"] == 3000.0
+        assert data["breakdown"]["by_category"] == {"Housing": 1000.0}
+        assert "incomes" not in data
+        assert json.loads(out_path.read_text(encoding="utf-8")) == data
+
+    def test_summary_report_mode(self, tmp_path, capsys):
+        p = tmp_path / "budget.csv"
+        p.write_text("type,name,category,amount\nexpense,Rent,Housing,1000\n", encoding="utf-8")
+        ret = main(["--input", str(p), "--summary", "--month", "2025-08"])
+        assert ret == 0
+        out = capsys.readouterr().out
+        assert "2025-08" in out
+        assert "Housing" in out
+
     def test_missing_input_file_returns_2(self, capsys):
         ret = main(["--input", "/nonexistent/path/file.csv"])
         assert ret == 2
@@ -0,0 +1,39 @@
+"""
+Tests for the Excel export of budget_manager_gui.py.
+
+Skipped when tkinter or openpyxl is not installed.
+
+Run:
+    pytest tests/test_budget_manager_gui.py
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tkinter")
+openpyxl = pytest.importorskip("openpyxl")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from budget_manager import BudgetMonth  # noqa: E402
+from budget_manager_gui import _write_excel_report  # noqa: E402
+
+# ===========================================================================
+# _write_excel_report
+# ===========================================================================
+
+class TestExcelExport:
+    def test_tables_have_header_filters(self, tmp_path):
+        bm = BudgetMonth(month="2025-08")
+        bm.add_income("Salary", 5000, "2025-08-01")
+        bm.add_expense("Rent", 1500, "Housing", "2025-08-03")
+        bm.add_expense("Groceries", 400, "Food")
+        path = tmp_path / "report.xlsx"
+        _write_excel_report(str(path), bm, "2025-08")
+
+        wb = openpyxl.load_workbook(path)
+        tables = {t.displayName: t for ws in wb.worksheets for t in ws.tables.values()}
+        assert set(tables) == {"IncomeTable", "ExpensesTable", "BreakdownTable"}
+        for table in tables.values():
+            assert table.autoFilter is not None
+            assert table.autoFilter.ref == table.ref